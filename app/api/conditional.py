@@ -0,0 +1,86 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Protocol
+
+from fastapi import Request, Response, status
+
+
+
+class Versioned(Protocol):
+    """A per-book ``CatalogVersion`` row or the catalog-wide ``CatalogStamp``."""
+
+    version: int
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class Validators:
+    """ETag/Last-Modified pair for a representation derived from a catalog version row."""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def for_version(cls, tag: str, version: Optional[Versioned]) -> "Validators":
+        # Rows only appear on the first change, so untouched data reports version 0.
+        if version is None:
+            return cls(etag=f'"{tag}-0"')
+        return cls(
+            etag=f'"{tag}-{version.version}"',
+            last_modified=version.updated_at.replace(tzinfo=timezone.utc),
+        )
+
+    @classmethod
+    def for_query(cls, tag: str, request: Request, version: Optional[Versioned]) -> "Validators":
+        """Validators for a listing; the query string is folded in so each page and filter gets its own tag."""
+        query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+        digest = hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+        return cls.for_version(f"{tag}-{digest}", version)
+
+    @property
+    def settled_last_modified(self) -> Optional[datetime]:
+        """``last_modified`` once its second is over, else ``None``.
+
+        Last-Modified has one-second resolution, so a date handed out while its
+        second is still running could hide a later change in that same second.
+        """
+        if self.last_modified is None:
+            return None
+        if datetime.now(timezone.utc) < self.last_modified + timedelta(seconds=1):
+            return None
+        return self.last_modified
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        last_modified = self.settled_last_modified
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+        return headers
+
+    def not_modified(self, request: Request) -> Optional[Response]:
+        """A bodyless 304 when the client's cached copy is still current, else ``None``."""
+        if self._is_fresh(request):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers)
+        return None
+
+    def _is_fresh(self, request: Request) -> bool:
+        # If-None-Match wins over If-Modified-Since when both are sent (RFC 9110 13.2.2).
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return self.etag in candidates
+
+        if_modified_since = request.headers.get("if-modified-since")
+        last_modified = self.settled_last_modified
+        if if_modified_since is None or last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified <= since
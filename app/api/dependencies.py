@@ -1,10 +1,38 @@
-from fastapi import Depends
+from typing import AsyncGenerator, List, Optional, Type
+
+import httpx
+from fastapi import Depends, HTTPException, Query, Request, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, SessionLocal, get_db
+from app.schemas.pagination import MAX_BATCH_IDS
+from app.services.ai_assistant_service import AIAssistantService
 from app.services.book_service import BookService
+from app.services.circulation_service import CirculationService
 from app.services.librarian_service import LibrarianService
 from app.services.user_service import UserService
+from app.services.work_service import WorkService
+
+
+def get_http_client(request: Request) -> httpx.AsyncClient:
+    return request.app.state.http_client
+
+
+async def get_assistant_service(
+    http_client: httpx.AsyncClient = Depends(get_http_client),
+) -> AsyncGenerator[AIAssistantService, None]:
+    """Use an AsyncSession when ASYNC_DATABASE_URL is configured, else a sync session off-loop."""
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield AIAssistantService(db, http_client)
+        return
+
+    db = SessionLocal()
+    try:
+        yield AIAssistantService(db, http_client)
+    finally:
+        db.close()
 
 
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
@@ -19,3 +47,68 @@ def get_librarian_service(db: Session = Depends(get_db)) -> LibrarianService:
     return LibrarianService(db)
 
 
+def get_work_service(db: Session = Depends(get_db)) -> WorkService:
+    return WorkService(db)
+
+
+def get_circulation_service(db: Session = Depends(get_db)) -> CirculationService:
+    return CirculationService(db)
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class PageParams:
+    def __init__(
+        self,
+        cursor: Optional[int] = Query(None, description="Return rows with an id greater than this cursor"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+class WorkPageParams:
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="Return works after this one; pass the previous page's next_cursor"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """Turn a ``fields=a,b`` query value into a column list; ``id`` is always included for the cursor."""
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - set(schema.model_fields))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    return ["id", *(field for field in dict.fromkeys(requested) if field != "id")]
+
+
+def parse_ids(ids: Optional[str]) -> Optional[List[int]]:
+    """Turn an ``ids=3,1,2`` query value into distinct ids, keeping their order."""
+    if ids is None:
+        return None
+    try:
+        requested = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        requested = []
+    if not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of integers",
+        )
+    if len(requested) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_IDS} ids can be fetched at once",
+        )
+    return requested
@@ -0,0 +1,57 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.telemetry import (
+    DB_QUERIES_PER_REQUEST,
+    DB_SECONDS_PER_REQUEST,
+    HTTP_IN_FLIGHT,
+    HTTP_REQUEST_SECONDS,
+    HTTP_RESPONSES,
+    RequestStats,
+    current_request_stats,
+    report_request,
+)
+
+
+class MetricsMiddleware:
+    """Record latency, status and DB work per route template.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware`` so streaming responses pass
+    through untouched and the per-request cost stays a few counter updates.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats(scope=scope)
+        token = current_request_stats.set(stats)
+        HTTP_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            current_request_stats.reset(token)
+            # The route template rather than the raw path keeps label cardinality bounded.
+            route_path = stats.route
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.observe(elapsed, method, route_path)
+            HTTP_RESPONSES.inc(method, route_path, str(status_code))
+            DB_QUERIES_PER_REQUEST.observe(stats.queries, route_path)
+            DB_SECONDS_PER_REQUEST.observe(stats.db_seconds, route_path)
+            report_request(stats)
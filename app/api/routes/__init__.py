@@ -1,11 +1,14 @@
 from fastapi import APIRouter
 
-from app.api.routes import assistant, books, librarians, users
+from app.api.routes import admin, assistant, books, circulation, librarians, metrics, users
 
 api_router = APIRouter()
 api_router.include_router(users.router)
 api_router.include_router(librarians.router)
 api_router.include_router(books.router)
+api_router.include_router(circulation.router)
 api_router.include_router(assistant.router)
+api_router.include_router(admin.router)
+api_router.include_router(metrics.router)
 
 __all__ = ["api_router"]
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+
+from app.core.book_cache import get_book_read_cache
+from app.core.database import async_engine, engine
+from app.core.db_pool import pool_status
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/db-pool")
+def get_db_pool_status():
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool) if async_engine is not None else None,
+    }
+
+
+@router.get("/book-cache")
+def get_book_cache_stats():
+    cache = get_book_read_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
@@ -1,8 +1,12 @@
+import json
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from markdown import markdown
 from pydantic import BaseModel
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_assistant_service
+from app.core.answer_cache import get_answer_cache
 from app.schemas.assistant import AssistantRequest, AssistantResponse
 from app.services.ai_assistant_service import AIAssistantService
 
@@ -16,8 +20,10 @@ class AssistantResponse(BaseModel):
 
 
 @router.post("/chat", response_model=AssistantResponse)
-async def ask_assistant(payload: AssistantRequest, db=Depends(get_db)):
-    service = AIAssistantService(db)
+async def ask_assistant(
+    payload: AssistantRequest,
+    service: AIAssistantService = Depends(get_assistant_service),
+):
     result = await service.handle_query(payload.query.strip())
     
     # Generate HTML response with book table if books are found
@@ -27,4 +33,28 @@ async def ask_assistant(payload: AssistantRequest, db=Depends(get_db)):
         "response": result["response"],
         "response_html": html_response,
         "matches": result["matches"],
-    }
\ No newline at end of file
+    }
+
+
+@router.post("/chat/stream")
+async def stream_assistant(
+    payload: AssistantRequest,
+    service: AIAssistantService = Depends(get_assistant_service),
+):
+    """Server-sent events: ``books`` first, then ``token`` deltas, then ``done`` (or ``error``)."""
+    prepared = await service.prepare_query(payload.query.strip())
+
+    async def events():
+        async for event, data in service.stream_query(prepared):
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/metrics")
+def assistant_metrics():
+    return {"answer_cache": get_answer_cache().stats()}
@@ -1,17 +1,100 @@
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.api.dependencies import get_book_service
-from app.schemas.book import BookCreate, BookRead, BookUpdate
+from app.api.conditional import Validators
+from app.api.dependencies import (
+    PageParams,
+    WorkPageParams,
+    get_book_service,
+    get_work_service,
+    parse_fields,
+    parse_ids,
+)
+from app.core.telemetry import query_budget
+from app.schemas.book import (
+    BookCreate,
+    BookImportProgress,
+    BookRead,
+    BookUpdate,
+    InventoryAdjustment,
+    InventoryBatchResult,
+    WorkPage,
+)
+from app.schemas.export import ExportFormat
+from app.schemas.pagination import Batch, Page
 from app.services.book_service import BookService
+from app.services.export import MEDIA_TYPES
+from app.services.work_service import WorkService
 
 router = APIRouter(prefix="/books", tags=["books"])
 
 
-@router.get("/", response_model=List[BookRead])
-def list_books(service: BookService = Depends(get_book_service)):
-    return service.list_books()
+@router.get("/", response_model=Union[Page[BookRead], Batch[BookRead]])
+@query_budget(6)
+def list_books(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    ids: Optional[str] = Query(
+        None, description="Comma-separated book ids to fetch instead of a page; filters are ignored"
+    ),
+    category: Optional[str] = None,
+    book_type: Optional[str] = None,
+    location: Optional[str] = None,
+    available: Optional[bool] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated BookRead fields to return"),
+    service: BookService = Depends(get_book_service),
+):
+    selected = parse_fields(fields, BookRead)
+    book_ids = parse_ids(ids)
+    validators = Validators.for_query("books", request, service.catalog_version())
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+
+    if book_ids is not None:
+        result = service.get_books(book_ids, fields=selected)
+    else:
+        result = service.list_books(
+            limit=page.limit,
+            cursor=page.cursor,
+            fields=selected,
+            category=category,
+            book_type=book_type,
+            location=location,
+            available=available,
+        )
+    if selected is not None:
+        return JSONResponse(jsonable_encoder(result), headers=validators.headers)
+    response.headers.update(validators.headers)
+    return result
+
+
+@router.get("/export")
+@query_budget(2)
+def export_books(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: BookService = Depends(get_book_service),
+):
+    return StreamingResponse(
+        service.export_books(export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="books.{export_format.value}"'},
+    )
+
+
+@router.get("/works", response_model=WorkPage)
+@query_budget(2)
+def list_works(
+    page: WorkPageParams = Depends(),
+    title: Optional[str] = Query(None, description="Case-insensitive title substring"),
+    service: WorkService = Depends(get_work_service),
+):
+    return service.list_works(limit=page.limit, cursor=page.cursor, title=title)
 
 
 @router.post(
@@ -19,6 +102,7 @@ def list_books(service: BookService = Depends(get_book_service)):
     response_model=BookRead,
     status_code=status.HTTP_201_CREATED,
 )
+@query_budget(10)
 def create_book(
     payload: BookCreate,
     service: BookService = Depends(get_book_service),
@@ -26,18 +110,64 @@ def create_book(
     return service.create_book(payload)
 
 
+@router.post("/bulk", response_model=BookImportProgress)
+async def bulk_import_books(
+    request: Request,
+    chunk_size: int = Query(500, ge=1, le=5000),
+    progress: bool = Query(False, description="Stream NDJSON progress after each chunk"),
+    service: BookService = Depends(get_book_service),
+):
+    content_type = request.headers.get("content-type", "")
+    body = await request.body()
+    try:
+        records = await run_in_threadpool(service.parse_import, body, content_type)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    batches = service.import_books(records, chunk_size)
+    if progress:
+        return StreamingResponse(
+            (batch.model_dump_json() + "\n" for batch in batches),
+            media_type="application/x-ndjson",
+        )
+    return await run_in_threadpool(service.collect_import, batches)
+
+
+@router.patch("/inventory", response_model=InventoryBatchResult)
+# One chunk: lock the counts, find books without a row, update, insert, bump versions.
+@query_budget(5)
+def adjust_inventory(
+    payload: List[InventoryAdjustment],
+    chunk_size: int = Query(500, ge=1, le=5000),
+    service: BookService = Depends(get_book_service),
+):
+    return service.adjust_inventory(payload, chunk_size)
+
+
 @router.get("/{book_id}", response_model=BookRead)
+@query_budget(5)
 def get_book(
     book_id: int,
+    request: Request,
+    response: Response,
     service: BookService = Depends(get_book_service),
 ):
-    result = service.get_book(book_id)
+    version = service.catalog_version(book_id)
+    validators = Validators.for_version(f"book-{book_id}", version)
+    not_modified = validators.not_modified(request)
+    if not_modified is not None:
+        return not_modified
+
+    # The same version row keys the cache, so the body always matches the ETag.
+    result = service.get_book(book_id, version)
     if not result:
         raise HTTPException(status_code=404, detail="Book not found")
+    response.headers.update(validators.headers)
     return result
 
 
 @router.put("/{book_id}", response_model=BookRead)
+@query_budget(12)
 def update_book(
     book_id: int,
     payload: BookUpdate,
@@ -50,6 +180,7 @@ def update_book(
 
 
 @router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(11)
 def delete_book(
     book_id: int,
     service: BookService = Depends(get_book_service),
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.dependencies import get_circulation_service
+from app.schemas.transaction import CirculationRequest, CirculationResponse
+from app.services.circulation_service import CirculationError, CirculationService
+
+router = APIRouter(prefix="/circulation", tags=["circulation"])
+
+
+@router.post(
+    "/borrow",
+    response_model=CirculationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def borrow_book(
+    payload: CirculationRequest,
+    service: CirculationService = Depends(get_circulation_service),
+):
+    try:
+        result = service.borrow(payload.book_id, payload.user_id)
+    except CirculationError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    if not result:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book or user not found")
+    return result
+
+
+@router.post(
+    "/return",
+    response_model=CirculationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def return_book(
+    payload: CirculationRequest,
+    service: CirculationService = Depends(get_circulation_service),
+):
+    try:
+        result = service.return_book(payload.book_id, payload.user_id)
+    except CirculationError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    if not result:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book or user not found")
+    return result
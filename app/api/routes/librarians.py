@@ -1,23 +1,42 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
-from app.api.dependencies import get_librarian_service
+from app.api.dependencies import (
+    PageParams,
+    get_librarian_service,
+    parse_fields,
+)
+from app.core.telemetry import query_budget
 from app.schemas.librarian import (
     LibrarianCreate,
     LibrarianRead,
     LibrarianUpdate,
 )
+from app.schemas.pagination import Page
 from app.services.librarian_service import LibrarianService
 
 router = APIRouter(prefix="/librarians", tags=["librarians"])
 
 
-@router.get("/", response_model=List[LibrarianRead])
+@router.get("/", response_model=Page[LibrarianRead])
+@query_budget(2)
 def list_librarians(
+    page: PageParams = Depends(),
+    fields: Optional[str] = Query(None, description="Comma-separated LibrarianRead fields to return"),
     service: LibrarianService = Depends(get_librarian_service),
 ):
-    return service.list_librarians()
+    selected = parse_fields(fields, LibrarianRead)
+    result = service.list_librarians(
+        limit=page.limit,
+        cursor=page.cursor,
+        fields=selected,
+    )
+    if selected is not None:
+        return JSONResponse(jsonable_encoder(result))
+    return result
 
 
 @router.post(
@@ -25,6 +44,7 @@ def list_librarians(
     response_model=LibrarianRead,
     status_code=status.HTTP_201_CREATED,
 )
+@query_budget(3)
 def create_librarian(
     payload: LibrarianCreate,
     service: LibrarianService = Depends(get_librarian_service),
@@ -33,6 +53,7 @@ def create_librarian(
 
 
 @router.get("/{librarian_id}", response_model=LibrarianRead)
+@query_budget(2)
 def get_librarian(
     librarian_id: int,
     service: LibrarianService = Depends(get_librarian_service),
@@ -44,6 +65,7 @@ def get_librarian(
 
 
 @router.put("/{librarian_id}", response_model=LibrarianRead)
+@query_budget(4)
 def update_librarian(
     librarian_id: int,
     payload: LibrarianUpdate,
@@ -59,6 +81,7 @@ def update_librarian(
     "/{librarian_id}",
     status_code=status.HTTP_204_NO_CONTENT,
 )
+@query_budget(3)
 def delete_librarian(
     librarian_id: int,
     service: LibrarianService = Depends(get_librarian_service),
@@ -0,0 +1,57 @@
+from typing import Iterator, Tuple
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.answer_cache import get_answer_cache
+from app.core.database import async_engine, engine
+from app.core.db_pool import pool_status
+from app.core.metrics import CallbackMetric, registry
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+POOL_FIELDS = ("size", "checked_out", "idle", "overflow", "checkouts", "timeouts")
+
+
+def _pool_samples() -> Iterator[Tuple[Tuple[str, ...], float]]:
+    engines = {"sync": engine, "async": async_engine}
+    for name, current in engines.items():
+        if current is None:
+            continue
+        status = pool_status(current.pool)
+        for field in POOL_FIELDS:
+            if field in status:
+                yield (name, field), status[field]
+
+
+def _answer_cache_samples() -> Iterator[Tuple[Tuple[str, ...], float]]:
+    stats = get_answer_cache().stats()
+    for field in ("hits", "misses", "invalidations"):
+        yield (field,), stats[field]
+
+
+def _answer_cache_saved_seconds() -> Iterator[Tuple[Tuple[str, ...], float]]:
+    yield (), get_answer_cache().stats()["saved_seconds"]
+
+
+CallbackMetric("lms_db_pool", "Connection pool state, from /admin/db-pool.", _pool_samples, ("engine", "field"))
+CallbackMetric(
+    "lms_answer_cache_events_total",
+    "Assistant answer cache lookups and invalidations.",
+    _answer_cache_samples,
+    ("event",),
+    kind="counter",
+)
+CallbackMetric(
+    "assistant_answer_cache_saved_seconds_total",
+    "Completion time avoided by answer cache hits, at the running average completion time.",
+    _answer_cache_saved_seconds,
+    kind="counter",
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,20 +1,56 @@
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from app.api.dependencies import get_user_service
-from app.schemas.user import UserCreate, UserRead, UserUpdate
+from app.api.dependencies import PageParams, get_user_service, parse_fields
+from app.core.telemetry import query_budget
+from app.models.user import UserRole
+from app.schemas.export import ExportFormat
+from app.schemas.pagination import Batch, Page
+from app.schemas.user import UserBatchRequest, UserCreate, UserRead, UserUpdate
+from app.services.export import MEDIA_TYPES
 from app.services.user_service import UserService
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@router.get("/", response_model=List[UserRead])
-def list_users(service: UserService = Depends(get_user_service)):
-    return service.list_users()
+@router.get("/", response_model=Page[UserRead])
+@query_budget(2)
+def list_users(
+    page: PageParams = Depends(),
+    role: Optional[UserRole] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated UserRead fields to return"),
+    service: UserService = Depends(get_user_service),
+):
+    selected = parse_fields(fields, UserRead)
+    result = service.list_users(
+        limit=page.limit,
+        cursor=page.cursor,
+        fields=selected,
+        role=role,
+    )
+    if selected is not None:
+        return JSONResponse(jsonable_encoder(result))
+    return result
+
+
+@router.get("/export")
+@query_budget(2)
+def export_users(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    service: UserService = Depends(get_user_service),
+):
+    return StreamingResponse(
+        service.export_users(export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="users.{export_format.value}"'},
+    )
 
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+@query_budget(3)
 def create_user(
     payload: UserCreate,
     service: UserService = Depends(get_user_service),
@@ -22,7 +58,17 @@ def create_user(
     return service.create_user(payload)
 
 
+@router.post("/batch", response_model=Batch[UserRead])
+@query_budget(2)
+def get_users(
+    payload: UserBatchRequest,
+    service: UserService = Depends(get_user_service),
+):
+    return service.get_users(list(dict.fromkeys(payload.ids)))
+
+
 @router.get("/{user_id}", response_model=UserRead)
+@query_budget(2)
 def get_user(
     user_id: int,
     service: UserService = Depends(get_user_service),
@@ -34,6 +80,7 @@ def get_user(
 
 
 @router.put("/{user_id}", response_model=UserRead)
+@query_budget(4)
 def update_user(
     user_id: int,
     payload: UserUpdate,
@@ -46,6 +93,7 @@ def update_user(
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(3)
 def delete_user(
     user_id: int,
     service: UserService = Depends(get_user_service),
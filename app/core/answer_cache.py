@@ -0,0 +1,116 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core import catalog_events
+from app.core.config import Settings, get_settings
+
+
+class AnswerCache:
+    """LRU of assistant answers keyed on the normalized query and the context sent to the model.
+
+    Entries remember which books contributed to their context so they can be
+    dropped as soon as one of those books changes.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, float, Tuple[int, ...]]]" = OrderedDict()
+        self._keys_by_book: Dict[int, Set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.completions = 0
+        self.completion_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AnswerCache":
+        return cls(max_size=settings.answer_cache_size, ttl=settings.answer_cache_ttl)
+
+    @staticmethod
+    def key(normalized_query: str, context_blocks: Iterable[str]) -> str:
+        digest = hashlib.sha256(normalized_query.encode("utf-8"))
+        for block in context_blocks:
+            digest.update(b"\0")
+            digest.update(block.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            # Credit each hit with the average completion time it avoided.
+            self.saved_seconds += self._average_completion()
+            return entry[0]
+
+    def set(self, key: str, answer: str, book_ids: Iterable[int], completion_seconds: float) -> None:
+        ids = tuple(set(book_ids))
+        with self._lock:
+            self.completions += 1
+            self.completion_seconds += completion_seconds
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (answer, time.time() + self.ttl, ids)
+            for book_id in ids:
+                self._keys_by_book[book_id].add(key)
+            while len(self._entries) > self.max_size:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_books(self, book_ids: List[int]) -> None:
+        with self._lock:
+            for book_id in book_ids:
+                for key in list(self._keys_by_book.get(book_id, ())):
+                    self._drop(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry; the hit/miss counters keep running."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_book.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "average_completion_seconds": self._average_completion(),
+                "saved_seconds": self.saved_seconds,
+            }
+
+    def _average_completion(self) -> float:
+        return self.completion_seconds / self.completions if self.completions else 0.0
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for book_id in entry[2]:
+            keys = self._keys_by_book.get(book_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_book[book_id]
+
+
+@lru_cache
+def get_answer_cache() -> AnswerCache:
+    cache = AnswerCache.from_settings(get_settings())
+    catalog_events.subscribe(cache.invalidate_books)
+    return cache
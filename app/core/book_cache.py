@@ -0,0 +1,119 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Generic, Iterable, Mapping, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.config import Settings, get_settings
+
+T = TypeVar("T")
+
+# session.info key holding ids touched by the transaction in progress.
+CHANGED_BOOKS_KEY = "changed_book_ids"
+
+
+def mark_books_changed(session: Session, book_ids: Iterable[int]) -> None:
+    """Record ids changed by bulk/Core statements, which the flush hook cannot see."""
+    session.info.setdefault(CHANGED_BOOKS_KEY, set()).update(book_ids)
+
+
+class BookReadCache(Generic[T]):
+    """Bounded LRU of serialized books keyed by id and catalog version.
+
+    An entry only serves readers that looked up the same ``catalog_versions``
+    counter, so a change committed by another worker is a miss here even though
+    only the writing worker's cache is invalidated. Invalidation just frees the
+    superseded entries early.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[int, T]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "BookReadCache":
+        return cls(max_size=settings.book_cache_size)
+
+    def get(self, book_id: int, version: int) -> Optional[T]:
+        with self._lock:
+            entry = self._entries.get(book_id)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(book_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, book_id: int, version: int, value: T) -> None:
+        """Store ``value`` as loaded at ``version``; the version must have been read first."""
+        with self._lock:
+            current = self._entries.get(book_id)
+            if current is not None and current[0] > version:
+                return
+            self._entries[book_id] = (version, value)
+            self._entries.move_to_end(book_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, book_ids: Iterable[int]) -> None:
+        with self._lock:
+            for book_id in book_ids:
+                if self._entries.pop(book_id, None) is not None:
+                    self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "entries": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+def track_session_changes(cache: BookReadCache, id_attributes: Mapping[type, str]) -> None:
+    """Invalidate ``cache`` when a commit touches any instance of the mapped classes.
+
+    ``id_attributes`` maps each class to the attribute holding its book id.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def collect(session: Session, flush_context: Any) -> None:
+        changed = set()
+        for instance in (*session.new, *session.dirty, *session.deleted):
+            attribute = id_attributes.get(type(instance))
+            book_id = getattr(instance, attribute, None) if attribute else None
+            if book_id is not None:
+                changed.add(book_id)
+        if changed:
+            mark_books_changed(session, changed)
+
+    @event.listens_for(Session, "after_commit")
+    def invalidate(session: Session) -> None:
+        changed = session.info.pop(CHANGED_BOOKS_KEY, None)
+        if changed:
+            cache.invalidate(changed)
+
+    @event.listens_for(Session, "after_transaction_end")
+    def discard(session: Session, transaction: SessionTransaction) -> None:
+        # Savepoint rollbacks keep the set: the outer transaction may still commit earlier changes.
+        if transaction.parent is None:
+            session.info.pop(CHANGED_BOOKS_KEY, None)
+
+
+@lru_cache
+def get_book_read_cache() -> Optional[BookReadCache]:
+    settings = get_settings()
+    if not settings.book_cache_enabled:
+        return None
+    return BookReadCache.from_settings(settings)
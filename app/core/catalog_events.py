@@ -0,0 +1,74 @@
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+
+from app.core.telemetry import untracked
+
+logger = logging.getLogger(__name__)
+
+CatalogListener = Callable[[List[int]], None]
+
+_listeners: List[CatalogListener] = []
+
+_catch_up_lock = threading.RLock()
+# The catalog_versions counters every listener has seen, and their sum.
+_seen_counters: Optional[Dict[int, int]] = None
+_seen_total: Optional[int] = None
+
+
+def subscribe(listener: CatalogListener) -> CatalogListener:
+    """Register ``listener`` to be called with the ids of books whose rows changed."""
+    _listeners.append(listener)
+    return listener
+
+
+def publish(book_ids: Iterable[int]) -> None:
+    """Announce committed changes to books or their inventory/acquisition rows.
+
+    Listeners run in their own sessions, so their statements are not charged
+    to the request that published the change.
+    """
+    ids = list(book_ids)
+    if not ids:
+        return
+    with untracked():
+        for listener in list(_listeners):
+            try:
+                listener(ids)
+            except Exception:
+                logger.exception("Catalog listener %r failed", listener)
+
+
+def caught_up(total: int) -> bool:
+    """Whether ``total``, the current sum of the catalog version counters, was already replayed here."""
+    return total == _seen_total
+
+
+def mark_caught_up(counters: Mapping[int, int]) -> None:
+    """Record ``counters`` as seen by every listener; take them just before a full rebuild."""
+    global _seen_counters, _seen_total
+    with _catch_up_lock:
+        _seen_counters = dict(counters)
+        _seen_total = sum(_seen_counters.values())
+
+
+def catch_up(total: int, load_counters: Callable[[], Mapping[int, int]]) -> None:
+    """Publish the books other processes changed since this one last caught up.
+
+    Writes served here publish as they commit; writes committed by other
+    workers only show up in the version counters. ``load_counters`` runs only
+    once ``total`` has moved, and the books whose counter differs from the
+    last one seen are published like a local change.
+    """
+    global _seen_counters, _seen_total
+    if caught_up(total):
+        return
+    # Held while the listeners run, so other readers wait instead of seeing the new total early.
+    with _catch_up_lock:
+        if caught_up(total):
+            return
+        counters = dict(load_counters())
+        seen = _seen_counters or {}
+        publish(book_id for book_id, version in counters.items() if seen.get(book_id) != version)
+        _seen_counters = counters
+        _seen_total = sum(counters.values())
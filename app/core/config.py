@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -9,9 +10,54 @@ class Settings(BaseSettings):
 
     app_name: str = Field(default="AI LMS API", alias="APP_NAME")
     database_url: str = Field(..., alias="DATABASE_URL")
+    # e.g. mysql+aiomysql://... or sqlite+aiosqlite:///...; enables the non-blocking assistant DB path.
+    async_database_url: Optional[str] = Field(default=None, alias="ASYNC_DATABASE_URL")
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    # Connections opened during startup so the first requests skip the connect cost.
+    db_pool_warm_connections: int = Field(default=0, alias="DB_POOL_WARM_CONNECTIONS")
+    # "create" runs create_all at startup, "verify" only checks the Alembic head, "skip" does neither.
+    schema_startup: Literal["create", "verify", "skip"] = Field(default="create", alias="SCHEMA_STARTUP")
+    # "native" ranks searches with MySQL FULLTEXT or SQLite FTS5 (migration 0003) instead of
+    # the in-process BM25 index; other dialects always use the in-process index.
+    search_backend: Literal["memory", "native"] = Field(default="memory", alias="SEARCH_BACKEND")
     openrouter_api_key: str = Field(default="", alias="OPENROUTER_API_KEY")
     openrouter_model: str = Field(..., alias="OPENROUTER_MODEL")
 
+    http2_enabled: bool = Field(default=True, alias="HTTP2_ENABLED")
+    http_max_connections: int = Field(default=100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_connections_per_host: int = Field(default=20, alias="HTTP_MAX_CONNECTIONS_PER_HOST")
+    http_max_keepalive_connections: int = Field(default=20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry: float = Field(default=30.0, alias="HTTP_KEEPALIVE_EXPIRY")
+    # Open connections to the upstream APIs during startup.
+    http_warmup: bool = Field(default=False, alias="HTTP_WARMUP")
+    http_warmup_timeout: float = Field(default=3.0, alias="HTTP_WARMUP_TIMEOUT")
+
+    summary_cache_size: int = Field(default=2048, alias="SUMMARY_CACHE_SIZE")
+    summary_cache_ttl: float = Field(default=7 * 24 * 3600, alias="SUMMARY_CACHE_TTL")
+    summary_cache_negative_ttl: float = Field(default=6 * 3600, alias="SUMMARY_CACHE_NEGATIVE_TTL")
+    summary_cache_path: Optional[str] = Field(default=None, alias="SUMMARY_CACHE_PATH")
+    summary_cache_disk_size: int = Field(default=20_000, alias="SUMMARY_CACHE_DISK_SIZE")
+    summary_fetch_concurrency: int = Field(default=5, alias="SUMMARY_FETCH_CONCURRENCY")
+    summary_fetch_deadline: float = Field(default=6.0, alias="SUMMARY_FETCH_DEADLINE")
+
+    answer_cache_size: int = Field(default=1024, alias="ANSWER_CACHE_SIZE")
+    answer_cache_ttl: float = Field(default=3600, alias="ANSWER_CACHE_TTL")
+
+    book_cache_enabled: bool = Field(default=True, alias="BOOK_CACHE_ENABLED")
+    book_cache_size: int = Field(default=4096, alias="BOOK_CACHE_SIZE")
+
+    # Strict mode turns a blown per-route query budget into an error, for test runs.
+    query_budget_strict: bool = Field(default=False, alias="QUERY_BUDGET_STRICT")
+    n_plus_one_threshold: int = Field(default=10, alias="N_PLUS_ONE_THRESHOLD")
+
+    # "inline" keeps the self-styled table; "compact" emits class names only for the client stylesheet.
+    assistant_table_style: str = Field(default="inline", alias="ASSISTANT_TABLE_STYLE")
+    assistant_table_cache_size: int = Field(default=4096, alias="ASSISTANT_TABLE_CACHE_SIZE")
+
 
 @lru_cache
 def get_settings() -> Settings:
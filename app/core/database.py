@@ -1,16 +1,40 @@
 from collections.abc import Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.core.config import get_settings
+from app.core.db_pool import pool_options
+from app.core.telemetry import instrument_engine
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, future=True)
+engine = create_engine(
+    settings.database_url,
+    future=True,
+    **pool_options(settings.database_url, settings),
+)
+instrument_engine(engine)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
 Base = declarative_base()
 
+async_engine = (
+    create_async_engine(
+        settings.async_database_url,
+        **pool_options(settings.async_database_url, settings, is_async=True),
+    )
+    if settings.async_database_url
+    else None
+)
+if async_engine is not None:
+    instrument_engine(async_engine.sync_engine)
+AsyncSessionLocal = (
+    async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -0,0 +1,123 @@
+import threading
+import time
+from contextlib import AsyncExitStack, ExitStack
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Engine, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config import Settings
+
+
+class CheckoutStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "average_wait_seconds": self.total_wait / attempts if attempts else 0.0,
+                "max_wait_seconds": self.max_wait,
+            }
+
+
+class CheckoutTimingMixin:
+    """Time every ``Pool.connect()``: queue wait plus any pre-ping or new-connection cost."""
+
+    checkout_stats: CheckoutStats
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.checkout_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(url: str, settings: Settings, is_async: bool = False) -> Dict[str, Any]:
+    """Engine keyword arguments for the configured pool; in-memory SQLite keeps its default pool."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout_seconds=pool.timeout(),
+        )
+    stats: Optional[CheckoutStats] = getattr(pool, "checkout_stats", None)
+    if stats is not None:
+        status.update(stats.snapshot())
+    return status
+
+
+def _warm_count(pool: Pool, connections: int) -> int:
+    # Overflow connections are closed on check-in, so only the persistent slots are worth filling.
+    if isinstance(pool, QueuePool):
+        return min(connections, pool.size())
+    return min(connections, 1)
+
+
+def warm_pool(engine: Engine, connections: int) -> int:
+    """Open up to ``connections`` pooled connections at once and return them to the pool idle."""
+    count = _warm_count(engine.pool, connections)
+    with ExitStack() as stack:
+        for _ in range(count):
+            stack.enter_context(engine.connect())
+    return count
+
+
+async def warm_async_pool(engine: AsyncEngine, connections: int) -> int:
+    count = _warm_count(engine.sync_engine.pool, connections)
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            await stack.enter_async_context(engine.connect())
+    return count
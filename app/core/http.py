@@ -0,0 +1,52 @@
+import asyncio
+import logging
+
+import httpx
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Upstreams the assistant talks to; each gets its own connection pool so one
+# slow host cannot take every connection from the other.
+POOLED_HOSTS = ("https://openrouter.ai", "https://openlibrary.org")
+
+
+def create_http_client(settings: Settings) -> httpx.AsyncClient:
+    """Build the application-scoped client; the lifespan owns opening and closing it."""
+    per_host_limits = httpx.Limits(
+        max_connections=settings.http_max_connections_per_host,
+        max_keepalive_connections=min(
+            settings.http_max_keepalive_connections,
+            settings.http_max_connections_per_host,
+        ),
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    mounts = {
+        host: httpx.AsyncHTTPTransport(http2=settings.http2_enabled, limits=per_host_limits)
+        for host in POOLED_HOSTS
+    }
+    return httpx.AsyncClient(
+        http2=settings.http2_enabled,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        ),
+        mounts=mounts,
+    )
+
+
+async def warm_http_client(client: httpx.AsyncClient, timeout: float) -> None:
+    """Open a connection to each upstream so the first real call skips DNS and the TLS handshake.
+
+    Failures are only logged; an unreachable upstream must not stop the app from starting.
+    """
+
+    async def touch(host: str) -> None:
+        try:
+            await client.head(host, timeout=timeout)
+        except httpx.HTTPError as error:
+            logger.warning("Could not warm the connection to %s: %s", host, error)
+
+    await asyncio.gather(*(touch(host) for host in POOLED_HOSTS))
@@ -0,0 +1,88 @@
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+# How a keyword has to line up with word boundaries in the text.
+WORD = "word"  # whole words only: "hi" does not fire inside "this"
+PREFIX = "prefix"  # starts a word: "explain" also fires for "explaining"
+SUBSTRING = "substring"  # anywhere, like ``keyword in text``
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class IntentClassifier:
+    """Aho-Corasick matcher mapping keyword phrases to intent names.
+
+    The automaton is built once from ``{intent: keywords}``; ``classify`` then
+    walks the text a single time regardless of how many keywords there are.
+    Each intent has its own boundary mode; intents not listed in ``modes`` use ``WORD``.
+    """
+
+    def __init__(
+        self,
+        keywords_by_intent: Mapping[str, Iterable[str]],
+        modes: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # (intent, keyword length, needs boundary before, needs boundary after)
+        self._outputs: List[List[Tuple[str, int, bool, bool]]] = [[]]
+
+        modes = modes or {}
+        for intent, keywords in keywords_by_intent.items():
+            mode = modes.get(intent, WORD)
+            if mode not in (WORD, PREFIX, SUBSTRING):
+                raise ValueError(f"Unknown match mode {mode!r} for intent {intent!r}")
+            for keyword in keywords:
+                self._insert(keyword.lower(), intent, mode)
+        self._link()
+
+    def classify(self, text: str) -> FrozenSet[str]:
+        """Every intent with at least one keyword in ``text`` (matched case-insensitively)."""
+        lowered = text.lower()
+        matched = set()
+        state = 0
+        for end, char in enumerate(lowered, start=1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for intent, length, bounded_start, bounded_end in self._outputs[state]:
+                if intent in matched:
+                    continue
+                start = end - length
+                if bounded_start and start > 0 and _is_word_char(lowered[start - 1]):
+                    continue
+                if bounded_end and end < len(lowered) and _is_word_char(lowered[end]):
+                    continue
+                matched.add(intent)
+        return frozenset(matched)
+
+    def _insert(self, keyword: str, intent: str, mode: str) -> None:
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        bounded_start = mode != SUBSTRING and _is_word_char(keyword[0])
+        bounded_end = mode == WORD and _is_word_char(keyword[-1])
+        self._outputs[state].append((intent, len(keyword), bounded_start, bounded_end))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
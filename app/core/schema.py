@@ -0,0 +1,65 @@
+from pathlib import Path
+from typing import List, Set
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Engine, MetaData, inspect
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+UPGRADE_HINT = (
+    "run `alembic upgrade head` (databases created by create_all before migrations existed: "
+    "`alembic stamp 0001` first)"
+)
+
+
+class SchemaOutOfDate(RuntimeError):
+    """The database is not at the migration head this code was written against."""
+
+
+def alembic_config() -> Config:
+    return Config(str(ALEMBIC_INI))
+
+
+def migration_heads() -> Set[str]:
+    return set(ScriptDirectory.from_config(alembic_config()).get_heads())
+
+
+def missing_schema(engine: Engine, metadata: MetaData) -> List[str]:
+    """Tables, and ``table.column`` names, in ``metadata`` that the database lacks."""
+    inspector = inspect(engine)
+    existing = set(inspector.get_table_names())
+    missing: List[str] = []
+    for table in metadata.sorted_tables:
+        if table.name not in existing:
+            missing.append(table.name)
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        missing.extend(f"{table.name}.{column.name}" for column in table.columns if column.name not in columns)
+    return missing
+
+
+def check_schema(engine: Engine, metadata: MetaData) -> None:
+    """Fail at startup, naming what is absent, rather than on the first request that needs it.
+
+    ``create_all`` adds missing tables but never columns to existing ones, so
+    this also runs after it.
+    """
+    missing = missing_schema(engine, metadata)
+    if missing:
+        raise SchemaOutOfDate(f"Database is missing {', '.join(missing)}; {UPGRADE_HINT}.")
+
+
+def verify_schema(engine: Engine, metadata: MetaData) -> None:
+    """Compare the ``alembic_version`` table with the migration scripts, then the tables themselves; no DDL."""
+    expected = migration_heads()
+    with engine.connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+    if current != expected:
+        raise SchemaOutOfDate(
+            f"Database is at revision {', '.join(sorted(current)) or '<none>'} but the code expects "
+            f"{', '.join(sorted(expected))}; {UPGRADE_HINT}."
+        )
+    check_schema(engine, metadata)
@@ -0,0 +1,138 @@
+import heapq
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class BookSearchIndex:
+    """In-process inverted index over the searchable book columns, ranked with BM25.
+
+    Field weights fold the old "title first" ordering into the term frequency
+    (a BM25F-style simplification), so a title hit outranks a shelf-location hit.
+    A query term also matches the tokens it is part of ("pott" finds "Potter"),
+    as the ``ilike '%term%'`` search did, but those matches score lower than
+    the whole token.
+    """
+
+    FIELD_WEIGHTS: Dict[str, float] = {
+        "title": 3.0,
+        "author": 2.0,
+        "category": 1.0,
+        "book_type": 1.0,
+        "book_location": 1.0,
+        "call_numbers": 1.0,
+    }
+    PARTIAL_MATCH_WEIGHT = 0.5
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self._doc_lengths: Dict[int, float] = {}
+        self._total_length = 0.0
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def rebuild(self, documents: Iterable[Tuple[int, Mapping[str, Optional[str]]]]) -> None:
+        with self._lock:
+            self._postings = defaultdict(dict)
+            self._doc_terms = {}
+            self._doc_lengths = {}
+            self._total_length = 0.0
+            for doc_id, fields in documents:
+                self._add(doc_id, fields)
+            self._ready = True
+
+    def upsert(self, doc_id: int, fields: Mapping[str, Optional[str]]) -> None:
+        with self._lock:
+            self._remove(doc_id)
+            self._add(doc_id, fields)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def search(self, query: str, limit: int = 20) -> List[int]:
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        with self._lock:
+            doc_count = len(self._doc_lengths)
+            if not doc_count:
+                return []
+            avg_length = self._total_length / doc_count or 1.0
+
+            scores: Dict[int, float] = defaultdict(float)
+            for term in terms:
+                # A document scores once per query term, through its best matching token.
+                term_scores: Dict[int, float] = {}
+                for token, weight in self._matching_tokens(term):
+                    postings = self._postings[token]
+                    idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for doc_id, frequency in postings.items():
+                        norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                        score = weight * idf * frequency * (self.k1 + 1) / (frequency + norm)
+                        if score > term_scores.get(doc_id, 0.0):
+                            term_scores[doc_id] = score
+                for doc_id, score in term_scores.items():
+                    scores[doc_id] += score
+
+        # Ties fall back to ascending id, matching the previous SQL ordering.
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [doc_id for doc_id, _ in best]
+
+    def _matching_tokens(self, term: str) -> List[Tuple[str, float]]:
+        return [
+            (token, 1.0 if token == term else self.PARTIAL_MATCH_WEIGHT)
+            for token in self._postings
+            if term in token
+        ]
+
+    def _add(self, doc_id: int, fields: Mapping[str, Optional[str]]) -> None:
+        frequencies: Dict[str, float] = defaultdict(float)
+        length = 0.0
+        for field, weight in self.FIELD_WEIGHTS.items():
+            for token in tokenize(fields.get(field)):
+                frequencies[token] += weight
+                length += weight
+
+        for token, frequency in frequencies.items():
+            self._postings[token][doc_id] = frequency
+        self._doc_terms[doc_id] = tuple(frequencies)
+        self._doc_lengths[doc_id] = length
+        self._total_length += length
+
+    def _remove(self, doc_id: int) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for token in terms:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._doc_lengths.pop(doc_id, 0.0)
+
+
+book_search_index = BookSearchIndex()
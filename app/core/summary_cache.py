@@ -0,0 +1,159 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from app.core.config import Settings, get_settings
+
+# Returned by SummaryCache.get when nothing (not even a negative entry) is cached.
+MISSING = object()
+
+
+class SummaryCache:
+    """Process-wide LRU of OpenLibrary summaries with TTLs and negative entries.
+
+    A ``None`` summary records that OpenLibrary had no description, and expires
+    after ``negative_ttl``. When ``path`` is set, entries are written through to
+    a SQLite file so they survive restarts and are visible to other workers;
+    that file keeps at most ``disk_size`` rows. ``aget``/``aset`` do the file
+    I/O in a worker thread so a locked database never stalls the event loop.
+    """
+
+    PRUNE_SQL = (
+        "DELETE FROM summaries WHERE expires_at <= ? OR key IN "
+        "(SELECT key FROM summaries ORDER BY expires_at DESC LIMIT -1 OFFSET ?)"
+    )
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        negative_ttl: float,
+        path: Optional[str] = None,
+        disk_size: int = 20_000,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.disk_size = disk_size
+        self._entries: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # One sqlite3 connection shared by worker threads; the memory tier never waits on it.
+        self._disk_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, summary TEXT, expires_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS ix_summaries_expires_at ON summaries (expires_at)")
+            self._db.execute(self.PRUNE_SQL, (time.time(), self.disk_size))
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SummaryCache":
+        return cls(
+            max_size=settings.summary_cache_size,
+            ttl=settings.summary_cache_ttl,
+            negative_ttl=settings.summary_cache_negative_ttl,
+            path=settings.summary_cache_path,
+            disk_size=settings.summary_cache_disk_size,
+        )
+
+    @staticmethod
+    def key(title: str) -> str:
+        return " ".join(title.lower().split())
+
+    def get(self, title: str):
+        """Return the cached summary, ``None`` for a cached miss, or ``MISSING``."""
+        key = self.key(title)
+        now = time.time()
+        found = self._recall(key, now)
+        if found is not MISSING or self._db is None:
+            return found
+        return self._load(key, now)
+
+    async def aget(self, title: str):
+        """``get`` with the disk read moved off the event loop."""
+        key = self.key(title)
+        now = time.time()
+        found = self._recall(key, now)
+        if found is not MISSING or self._db is None:
+            return found
+        return await asyncio.to_thread(self._load, key, now)
+
+    def set(self, title: str, summary: Optional[str]) -> None:
+        key = self.key(title)
+        expires_at = self._remember(key, summary)
+        if self._db is not None:
+            self._save(key, summary, expires_at)
+
+    async def aset(self, title: str, summary: Optional[str]) -> None:
+        """``set`` with the disk write moved off the event loop."""
+        key = self.key(title)
+        expires_at = self._remember(key, summary)
+        if self._db is not None:
+            await asyncio.to_thread(self._save, key, summary, expires_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            with self._disk_lock:
+                self._db.execute("DELETE FROM summaries")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _recall(self, key: str, now: float):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            if entry[1] <= now:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def _remember(self, key: str, summary: Optional[str]) -> float:
+        expires_at = time.time() + (self.ttl if summary is not None else self.negative_ttl)
+        with self._lock:
+            self._store(key, summary, expires_at)
+        return expires_at
+
+    def _load(self, key: str, now: float):
+        with self._disk_lock:
+            row = self._db.execute(
+                "SELECT summary, expires_at FROM summaries WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        if row is None:
+            return MISSING
+        with self._lock:
+            self._store(key, row[0], row[1])
+        return row[0]
+
+    def _save(self, key: str, summary: Optional[str], expires_at: float) -> None:
+        with self._disk_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, expires_at) VALUES (?, ?, ?)",
+                (key, summary, expires_at),
+            )
+            # Expired rows go first, then whatever is closest to expiry beyond disk_size.
+            self._db.execute(self.PRUNE_SQL, (time.time(), self.disk_size))
+
+    def _store(self, key: str, summary: Optional[str], expires_at: float) -> None:
+        self._entries[key] = (summary, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+@lru_cache
+def get_summary_cache() -> SummaryCache:
+    return SummaryCache.from_settings(get_settings())
@@ -0,0 +1,175 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from sqlalchemy import Engine, event
+
+from app.core.config import get_settings
+from app.core.metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "lms_http_request_duration_seconds",
+    "Time from request start until the response body is sent.",
+    ("method", "route"),
+)
+HTTP_RESPONSES = Counter("lms_http_responses_total", "Responses sent, by status code.", ("method", "route", "status"))
+HTTP_IN_FLIGHT = Gauge("lms_http_requests_in_flight", "Requests currently being served.")
+
+DB_QUERY_SECONDS = Histogram(
+    "lms_db_query_duration_seconds",
+    "Cursor execution time of individual SQL statements.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "lms_db_queries_per_request",
+    "SQL statements executed while serving one request.",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100, 250),
+)
+DB_SECONDS_PER_REQUEST = Histogram(
+    "lms_db_seconds_per_request",
+    "Total SQL execution time spent serving one request.",
+    ("route",),
+)
+UPSTREAM_SECONDS = Histogram(
+    "lms_upstream_request_duration_seconds",
+    "Latency of calls to external APIs.",
+    ("service", "outcome"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0),
+)
+QUERY_BUDGET_EXCEEDED = Counter(
+    "lms_db_query_budget_exceeded_total",
+    "Requests that ran more SQL statements than their route's budget.",
+    ("route",),
+)
+REPEATED_STATEMENTS = Counter(
+    "lms_db_repeated_statements_total",
+    "Requests that repeated one statement shape past the N+1 threshold.",
+    ("route",),
+)
+
+QUERY_BUDGET_ATTRIBUTE = "__query_budget__"
+UNMATCHED_ROUTE = "unmatched"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in strict mode by the first statement past a route's query budget."""
+
+
+def query_budget(limit: int) -> Callable[[F], F]:
+    """Declare the most SQL statements one call of this route may run.
+
+    Apply it under the ``@router`` decorator so the registered endpoint carries it.
+    """
+
+    def decorate(endpoint: F) -> F:
+        setattr(endpoint, QUERY_BUDGET_ATTRIBUTE, limit)
+        return endpoint
+
+    return decorate
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    # The ASGI scope; the router fills in the matched route before any endpoint code runs.
+    scope: Optional[Dict[str, Any]] = None
+    statements: Dict[str, int] = field(default_factory=dict)
+    repeated: bool = False
+
+    @property
+    def route(self) -> str:
+        route = (self.scope or {}).get("route")
+        return getattr(route, "path", UNMATCHED_ROUTE)
+
+    @property
+    def budget(self) -> Optional[int]:
+        route = (self.scope or {}).get("route")
+        return getattr(getattr(route, "endpoint", None), QUERY_BUDGET_ATTRIBUTE, None)
+
+    def over_budget(self) -> bool:
+        budget = self.budget
+        return budget is not None and self.queries > budget
+
+
+# Set by the metrics middleware for the duration of each HTTP request.
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+QUERY_STARTED_KEY = "query_started"
+
+
+@contextmanager
+def untracked() -> Iterator[None]:
+    """Keep statements run inside the block off the current request's count."""
+    token = current_request_stats.set(None)
+    try:
+        yield
+    finally:
+        current_request_stats.reset(token)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement on ``engine`` and charge it to the current request, if any."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start(conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = current_request_stats.get()
+        if stats is not None and get_settings().query_budget_strict:
+            budget = stats.budget
+            if budget is not None and stats.queries >= budget:
+                raise QueryBudgetExceeded(
+                    f"{stats.route} exceeded its budget of {budget} queries at: {statement}"
+                )
+        conn.info.setdefault(QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def finish(conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info[QUERY_STARTED_KEY].pop()
+        DB_QUERY_SECONDS.observe(elapsed)
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += elapsed
+            _check_repeats(stats, statement)
+
+    @event.listens_for(engine, "handle_error")
+    def discard(context) -> None:
+        started = context.connection.info.get(QUERY_STARTED_KEY) if context.connection is not None else None
+        if started:
+            started.pop()
+
+
+def _check_repeats(stats: RequestStats, statement: str) -> None:
+    # Bound parameters are not part of the text, so one shape per query pattern.
+    count = stats.statements.get(statement, 0) + 1
+    stats.statements[statement] = count
+    if count == get_settings().n_plus_one_threshold and not stats.repeated:
+        stats.repeated = True
+        REPEATED_STATEMENTS.inc(stats.route)
+        logger.warning("Possible N+1 in %s: statement ran %d times: %s", stats.route, count, statement)
+
+
+def report_request(stats: RequestStats) -> None:
+    """Flag a finished request that went over its route's query budget."""
+    if stats.over_budget():
+        QUERY_BUDGET_EXCEEDED.inc(stats.route)
+        logger.warning("%s ran %d queries, over its budget of %d", stats.route, stats.queries, stats.budget)
+
+
+@contextmanager
+def observe_upstream(service: str) -> Iterator[None]:
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        UPSTREAM_SECONDS.observe(time.perf_counter() - started, service, outcome)
@@ -0,0 +1,112 @@
+import heapq
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+
+TRIGRAM_FIELDS = ("title", "author")
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+
+
+def normalize(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return NON_ALNUM_PATTERN.sub(" ", text.lower()).strip()
+
+
+def trigrams(text: Optional[str]) -> Set[str]:
+    """Word trigrams in the pg_trgm style: each word padded with two leading and one trailing space."""
+    grams: Set[str] = set()
+    for word in normalize(text).split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def jaccard(shared: int, query_size: int, document_size: int) -> float:
+    union = query_size + document_size - shared
+    return shared / union if union else 0.0
+
+
+class TrigramIndex:
+    """In-memory trigram index over normalized book titles and authors."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Set[Tuple[int, str]]] = defaultdict(set)
+        self._doc_grams: Dict[Tuple[int, str], Set[str]] = {}
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def rebuild(self, documents: Iterable[Tuple[int, Mapping[str, Optional[str]]]]) -> None:
+        with self._lock:
+            self._postings = defaultdict(set)
+            self._doc_grams = {}
+            for doc_id, fields in documents:
+                self._add(doc_id, fields)
+            self._ready = True
+
+    def upsert(self, doc_id: int, fields: Mapping[str, Optional[str]]) -> None:
+        with self._lock:
+            self._remove(doc_id)
+            self._add(doc_id, fields)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            self._remove(doc_id)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> List[int]:
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        shared: Dict[Tuple[int, str], int] = defaultdict(int)
+        with self._lock:
+            for gram in query_grams:
+                for key in self._postings.get(gram, ()):
+                    shared[key] += 1
+
+            best: Dict[int, float] = {}
+            for key, count in shared.items():
+                score = jaccard(count, len(query_grams), len(self._doc_grams[key]))
+                if score >= threshold and score > best.get(key[0], 0.0):
+                    best[key[0]] = score
+
+        ranked = heapq.nsmallest(limit, best.items(), key=lambda item: (-item[1], item[0]))
+        return [doc_id for doc_id, _ in ranked]
+
+    def _add(self, doc_id: int, fields: Mapping[str, Optional[str]]) -> None:
+        for field in TRIGRAM_FIELDS:
+            grams = trigrams(fields.get(field))
+            if not grams:
+                continue
+            key = (doc_id, field)
+            self._doc_grams[key] = grams
+            for gram in grams:
+                self._postings[gram].add(key)
+
+    def _remove(self, doc_id: int) -> None:
+        for field in TRIGRAM_FIELDS:
+            grams = self._doc_grams.pop((doc_id, field), None)
+            if not grams:
+                continue
+            for gram in grams:
+                postings = self._postings.get(gram)
+                if postings is None:
+                    continue
+                postings.discard((doc_id, field))
+                if not postings:
+                    del self._postings[gram]
+
+
+book_trigram_index = TrigramIndex()
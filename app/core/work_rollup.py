@@ -0,0 +1,143 @@
+import threading
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class WorkRollup:
+    """Title+author ("work") aggregates maintained from copy-level rows.
+
+    Each group has the same shape ``AIAssistantService._group_books_by_title_author``
+    builds per request: copy totals, availability, status and call numbers.
+    Rows are ``(id, title, author, call_numbers, book_location, book_type,
+    total_copies, copies_available, status)``; ``total_copies`` is ``None``
+    when the book has no inventory row.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._members: Dict[str, Dict[int, Any]] = {}
+        self._key_by_book: Dict[int, str] = {}
+        self._groups: Dict[str, Dict[str, Any]] = {}
+        self._sorted_keys: Optional[List[Tuple[str, str]]] = None
+        self._ready = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @staticmethod
+    def key(title: str, author: str) -> str:
+        return f"{title}|||{author}".lower()
+
+    def rebuild(self, rows: Iterable[Any]) -> None:
+        with self._lock:
+            self._members = {}
+            self._key_by_book = {}
+            for row in rows:
+                self._add(row)
+            self._groups = {key: self._aggregate(members) for key, members in self._members.items()}
+            self._sorted_keys = None
+            self._ready = True
+
+    def refresh(self, book_ids: Iterable[int], rows: Iterable[Any]) -> None:
+        """Replace the copies in ``book_ids`` with ``rows``; ids without a row are dropped."""
+        with self._lock:
+            touched = set()
+            for book_id in book_ids:
+                key = self._key_by_book.pop(book_id, None)
+                if key is not None:
+                    self._members[key].pop(book_id, None)
+                    touched.add(key)
+            for row in rows:
+                touched.add(self._add(row))
+
+            for key in touched:
+                members = self._members.get(key)
+                if members:
+                    self._members[key] = dict(sorted(members.items()))
+                    self._groups[key] = self._aggregate(self._members[key])
+                else:
+                    self._members.pop(key, None)
+                    self._groups.pop(key, None)
+            self._sorted_keys = None
+
+    def groups_for(self, book_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Groups containing any of ``book_ids``, sorted by title."""
+        with self._lock:
+            keys = {self._key_by_book[book_id] for book_id in book_ids if book_id in self._key_by_book}
+            groups = [self._copy(self._groups[key]) for key in keys]
+        groups.sort(key=lambda group: group["title"].lower())
+        return groups
+
+    def member_ids(self, groups: Iterable[Dict[str, Any]]) -> List[int]:
+        with self._lock:
+            return [
+                book_id
+                for group in groups
+                for book_id in self._members.get(self.key(group["title"], group["author"]), ())
+            ]
+
+    def page(self, limit: int, after: Optional[str] = None, title: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Groups ordered by title then key, starting after the group keyed ``after``.
+
+        Seeking by key rather than position keeps pages stable while groups are
+        added or dropped between requests; ``after`` need not still exist.
+        """
+        with self._lock:
+            if self._sorted_keys is None:
+                self._sorted_keys = sorted((group["title"].lower(), key) for key, group in self._groups.items())
+            keys: Sequence[Tuple[str, str]] = self._sorted_keys
+            if title:
+                needle = title.lower()
+                keys = [entry for entry in keys if needle in entry[0]]
+            start = bisect_right(keys, self._position(after)) if after else 0
+            return [self._copy(self._groups[key]) for _, key in keys[start : start + limit]]
+
+    def _position(self, key: str) -> Tuple[str, str]:
+        group = self._groups.get(key)
+        if group is not None:
+            return group["title"].lower(), key
+        return key.split("|||", 1)[0], key
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def _add(self, row: Any) -> str:
+        key = self.key(row.title, row.author)
+        self._members.setdefault(key, {})[row.id] = row
+        self._key_by_book[row.id] = key
+        return key
+
+    @staticmethod
+    def _aggregate(members: Dict[int, Any]) -> Dict[str, Any]:
+        group: Dict[str, Any] = {
+            "title": "",
+            "author": "",
+            "total_copies": 0,
+            "available_copies": 0,
+            "call_numbers": [],
+            "location": "",
+            "book_type": "",
+            "status": "unknown",
+        }
+        for row in members.values():
+            group["title"] = row.title
+            group["author"] = row.author
+            group["location"] = row.book_location or group["location"]
+            group["book_type"] = row.book_type or group["book_type"]
+            if row.total_copies is None:
+                continue
+            group["total_copies"] += row.total_copies or 0
+            group["available_copies"] += row.copies_available or 0
+            status = row.status
+            group["status"] = getattr(status, "value", status) or "unknown"
+            if row.call_numbers and row.call_numbers not in group["call_numbers"]:
+                group["call_numbers"].append(row.call_numbers)
+        return group
+
+    @staticmethod
+    def _copy(group: Dict[str, Any]) -> Dict[str, Any]:
+        return {**group, "call_numbers": list(group["call_numbers"])}
+
+
+work_rollup = WorkRollup()
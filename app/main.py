@@ -1,22 +1,71 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.api.middleware import MetricsMiddleware
 from app.api.routes import api_router
-from app.core.config import get_settings
-from app.core.database import Base, engine
+from app.core.config import Settings, get_settings
+from app.core.database import Base, SessionLocal, async_engine, engine
+from app.core.db_pool import warm_async_pool, warm_pool
+from app.core.http import create_http_client, warm_http_client
+from app.core.schema import check_schema, verify_schema
 # Import models to ensure metadata registration
-from app.models import book, transaction, user  # noqa: F401
+from app.models import book, book_fulltext, book_trigram, catalog_version, transaction, user  # noqa: F401
+from app.repositories.book_repository import BookRepository
+from app.services.work_service import WorkService
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_schema(settings: Settings) -> None:
+	# Runs in the lifespan rather than at import so tooling that only imports the app stays fast.
+	if settings.schema_startup == "create":
+		Base.metadata.create_all(bind=engine)
+		check_schema(engine, Base.metadata)
+	elif settings.schema_startup == "verify":
+		verify_schema(engine, Base.metadata)
 
 
-def create_tables() -> None:
-	Base.metadata.create_all(bind=engine)
+def build_catalog_caches() -> None:
+	db = SessionLocal()
+	try:
+		repository = BookRepository(db)
+		# Before the rebuilds, so writes that land during them are replayed on the next catch-up.
+		repository.mark_caught_up()
+		repository.rebuild_search_index()
+		WorkService(db).rebuild()
+	finally:
+		db.close()
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+	settings = get_settings()
+	started = time.perf_counter()
+	prepare_schema(settings)
+	build_catalog_caches()
+	if settings.db_pool_warm_connections > 0:
+		warm_pool(engine, settings.db_pool_warm_connections)
+		if async_engine is not None:
+			await warm_async_pool(async_engine, settings.db_pool_warm_connections)
+	async with create_http_client(settings) as http_client:
+		application.state.http_client = http_client
+		if settings.http_warmup:
+			await warm_http_client(http_client, settings.http_warmup_timeout)
+		logger.info("Startup finished in %.2fs", time.perf_counter() - started)
+		yield
+	if async_engine is not None:
+		await async_engine.dispose()
 
 
 def create_app() -> FastAPI:
 	settings = get_settings()
-	application = FastAPI(title=settings.app_name)
+	application = FastAPI(title=settings.app_name, lifespan=lifespan)
 	application.include_router(api_router)
+	application.add_middleware(MetricsMiddleware)
 	return application
 
 
-create_tables()
 app = create_app()
@@ -0,0 +1,63 @@
+"""Native full-text structures over ``books``, created only on the dialect that uses them.
+
+MySQL gets FULLTEXT indexes on the table itself. SQLite gets an external-content
+FTS5 table that triggers keep in step with ``books``. Migration 0003 creates
+both; ``create_all`` creates them only when ``SEARCH_BACKEND=native``, so the
+in-process backend neither pays for them on every write nor needs FTS5.
+"""
+
+from sqlalchemy import DDL, Index, event
+
+from app.core.config import get_settings
+from app.models.book import Book
+
+FULLTEXT_COLUMNS = ("title", "author", "category", "book_type", "book_location", "call_numbers")
+
+FTS_TABLE = "books_fts"
+
+
+def _native_backend(ddl, target, bind, **kw) -> bool:
+    # Read at create time rather than import time, so tests and tooling can switch backends.
+    return get_settings().search_backend == "native"
+
+
+# MATCH needs an index whose column list is exactly the one searched, so the
+# title boost has its own index.
+# ``info["dialect"]`` tells the migration environment to compare them on MySQL only.
+Index(
+    "ix_books_fulltext",
+    *(Book.__table__.c[name] for name in FULLTEXT_COLUMNS),
+    mysql_prefix="FULLTEXT",
+    info={"dialect": "mysql"},
+).ddl_if(dialect="mysql", callable_=_native_backend)
+Index(
+    "ix_books_title_fulltext",
+    Book.__table__.c.title,
+    mysql_prefix="FULLTEXT",
+    info={"dialect": "mysql"},
+).ddl_if(dialect="mysql", callable_=_native_backend)
+
+_columns = ", ".join(FULLTEXT_COLUMNS)
+_new_values = ", ".join(f"new.{name}" for name in FULLTEXT_COLUMNS)
+_old_values = ", ".join(f"old.{name}" for name in FULLTEXT_COLUMNS)
+
+FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"{_columns}, content='books', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_insert AFTER INSERT ON books BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_delete AFTER DELETE ON books BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_update AFTER UPDATE OF {_columns} ON books BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values}); "
+    f"INSERT INTO {FTS_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values}); END",
+)
+
+for statement in FTS_DDL:
+    event.listen(
+        Book.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite", callable_=_native_backend),
+    )
+# The triggers go with the table; the FTS table would otherwise outlive it with stale rows.
+event.listen(Book.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"))
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, ForeignKey, Integer, String
+
+from app.core.database import Base
+
+
+class BookTrigram(Base):
+    __tablename__ = "book_trigrams"
+
+    trigram = Column(String(3), primary_key=True)
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True, index=True)
+    field = Column(String(16), primary_key=True)
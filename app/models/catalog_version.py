@@ -0,0 +1,13 @@
+from sqlalchemy import BigInteger, Column, Integer, TIMESTAMP
+
+from app.core.database import Base
+
+
+class CatalogVersion(Base):
+    """Per-book change counters for conditional GETs; listings use their sum."""
+
+    __tablename__ = "catalog_versions"
+
+    book_id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, nullable=False)
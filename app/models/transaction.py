@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, ForeignKey, Integer, TIMESTAMP
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer, TIMESTAMP
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -13,5 +13,9 @@ class Transaction(Base):
     type = Column(Enum("borrow", "return", name="transaction_type"), nullable=False)
     status = Column(Enum("pending", "done", name="transaction_status"), default="pending")
     timestamp = Column(TIMESTAMP)
+    # Set on a borrow once it is returned; open loans are the done borrows without it.
+    returned_at = Column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (Index("ix_transactions_loan", "book_id", "user_id"),)
 
     book = relationship("Book", back_populates="transactions")
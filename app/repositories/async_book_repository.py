@@ -0,0 +1,74 @@
+import asyncio
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core import catalog_events
+from app.core.search_index import book_search_index
+from app.core.trigram_index import book_trigram_index
+from app.models.book import Book
+from app.repositories.book_fulltext import get_fulltext_search
+from app.repositories.book_repository import BookRepository
+from app.repositories.book_trigram_repository import BookTrigramRepository
+from app.repositories.catalog_version_repository import CatalogVersionRepository
+
+
+class AsyncBookRepository:
+    """Async counterparts of the BookRepository reads the assistant needs."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_many(self, book_ids: List[int]) -> List[Book]:
+        if not book_ids:
+            return []
+        books = await self.db.scalars(
+            select(Book)
+            .options(
+                selectinload(Book.acquisition),
+                selectinload(Book.inventory),
+            )
+            .where(Book.id.in_(book_ids))
+        )
+        by_id = {book.id: book for book in books}
+        return [by_id[book_id] for book_id in book_ids if book_id in by_id]
+
+    async def catch_up(self) -> None:
+        """Async counterpart of ``BookRepository.catch_up``."""
+        total = await self.db.run_sync(lambda session: CatalogVersionRepository(session).total())
+        if catalog_events.caught_up(total):
+            return
+        counters = await self.db.run_sync(lambda session: CatalogVersionRepository(session).counters())
+        # Listeners read through the sync engine, so they run off the event loop.
+        await asyncio.to_thread(catalog_events.catch_up, total, lambda: counters)
+
+    async def search(self, query: str, limit: int = 20) -> List[Book]:
+        return await self.get_many(await self.search_ids(query, limit))
+
+    async def search_ids(self, query: str, limit: int = 20) -> List[int]:
+        if not query.split():
+            return []
+        await self.catch_up()
+
+        fulltext = get_fulltext_search(self.db.bind.dialect.name)
+        if fulltext is not None:
+            statement = fulltext.statement(query, limit)
+            book_ids = list(await self.db.scalars(statement)) if statement is not None else []
+            return book_ids or await self._fuzzy_ids(query, limit)
+
+        if not book_search_index.ready:
+            await self.db.run_sync(lambda session: BookRepository(session).rebuild_search_index())
+
+        book_ids = book_search_index.search(query, limit)
+        return book_ids or await self._fuzzy_ids(query, limit)
+
+    async def _fuzzy_ids(self, query: str, limit: int) -> List[int]:
+        if self.db.bind.dialect.name == "mysql":
+            return await self.db.run_sync(
+                lambda session: BookTrigramRepository(session).search(query, limit)
+            )
+        if not book_trigram_index.ready:
+            await self.db.run_sync(lambda session: BookRepository(session).rebuild_search_index())
+        return book_trigram_index.search(query, limit)
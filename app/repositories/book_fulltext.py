@@ -0,0 +1,74 @@
+from functools import lru_cache
+from typing import List, Optional
+
+from sqlalchemy import Select, column, literal_column, select, table, text
+from sqlalchemy.dialects.mysql import match
+
+from app.core.config import get_settings
+from app.core.search_index import BookSearchIndex, tokenize
+from app.models.book import Book
+from app.models.book_fulltext import FTS_TABLE, FULLTEXT_COLUMNS
+
+
+class FullTextSearch:
+    """Builds the ranked id query against one dialect's native full-text index.
+
+    Terms are re-tokenized to plain lowercase words, so no user input reaches the
+    index's own query syntax. Each term matches as a prefix and any term may match;
+    relevance is computed by the database.
+    """
+
+    def statement(self, query: str, limit: int) -> Optional[Select]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return None
+        return self._statement(terms, limit)
+
+    def _statement(self, terms: List[str], limit: int) -> Select:
+        raise NotImplementedError
+
+
+class MySQLFullTextSearch(FullTextSearch):
+    """``MATCH ... AGAINST`` in boolean mode over the FULLTEXT indexes from migration 0003."""
+
+    TITLE_BOOST = 2.0
+
+    def _statement(self, terms: List[str], limit: int) -> Select:
+        against = " ".join(f"{term}*" for term in terms)
+        matched = match(*(getattr(Book, name) for name in FULLTEXT_COLUMNS), against=against).in_boolean_mode()
+        title = match(Book.title, against=against).in_boolean_mode()
+        relevance = matched + title * self.TITLE_BOOST
+        return select(Book.id).where(matched).order_by(relevance.desc(), Book.id).limit(limit)
+
+
+class SQLiteFullTextSearch(FullTextSearch):
+    """FTS5 ``MATCH`` ranked by ``bm25`` with the in-process index's field weights."""
+
+    fts = table(FTS_TABLE, column("rowid"))
+    # bm25 scores are negative, best first when sorted ascending.
+    rank = text(
+        f"bm25({FTS_TABLE}, "
+        + ", ".join(str(BookSearchIndex.FIELD_WEIGHTS[name]) for name in FULLTEXT_COLUMNS)
+        + ")"
+    )
+
+    def _statement(self, terms: List[str], limit: int) -> Select:
+        expression = " OR ".join(f'"{term}"*' for term in terms)
+        return (
+            select(self.fts.c.rowid)
+            .where(literal_column(FTS_TABLE).op("MATCH")(expression))
+            .order_by(self.rank, self.fts.c.rowid)
+            .limit(limit)
+        )
+
+
+BACKENDS = {"mysql": MySQLFullTextSearch, "sqlite": SQLiteFullTextSearch}
+
+
+@lru_cache
+def get_fulltext_search(dialect_name: str) -> Optional[FullTextSearch]:
+    """The native backend for ``dialect_name``, or None to keep the in-process index."""
+    if get_settings().search_backend != "native":
+        return None
+    backend = BACKENDS.get(dialect_name)
+    return backend() if backend is not None else None
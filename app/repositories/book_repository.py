@@ -1,28 +1,103 @@
 import re
-from difflib import SequenceMatcher
-from typing import List, Optional
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import case, or_
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Row, case, insert, or_, select, update
+from sqlalchemy.exc import StatementError
+from sqlalchemy.orm import Session, load_only, selectinload
 
-from app.models.book import Book
+from app.core import catalog_events
+from app.core.book_cache import mark_books_changed
+from app.core.search_index import BookSearchIndex, book_search_index
+from app.core.trigram_index import TRIGRAM_FIELDS, TrigramIndex, book_trigram_index
+from app.models.book import Book, BookStatus
 from app.models.book_acquisition import BookAcquisition
 from app.models.book_inventory import BookInventory
+from app.repositories.book_fulltext import FullTextSearch, get_fulltext_search
+from app.repositories.book_trigram_repository import BookTrigramRepository
+from app.repositories.catalog_version_repository import CatalogVersionRepository
+from app.repositories.pagination import keyset
+
+AUTO_INCREMENT_STEP_KEY = "auto_increment_step"
 
 
 class BookRepository:
+    SEARCH_FIELDS = ("title", "author", "category", "book_type", "book_location", "call_numbers")
+
+    RELATIONS = {"acquisition": Book.acquisition, "inventory": Book.inventory}
+    BOOK_COLUMNS = tuple(column.key for column in Book.__table__.columns if column.key != "id")
+    # executemany needs every row to bind the same keys, so omitted values are filled in here.
+    ACQUISITION_DEFAULTS = {
+        column.key: None for column in BookAcquisition.__table__.columns if column.key != "book_id"
+    }
+    INVENTORY_DEFAULTS = {
+        "total_copies": 0,
+        "copies_available": 0,
+        "status": BookStatus.AVAILABLE.value,
+        "added_at": None,
+    }
+    EXPORT_COLUMNS = (
+        Book.id,
+        Book.title,
+        Book.author,
+        Book.isbn,
+        Book.category,
+        Book.pages,
+        Book.call_numbers,
+        Book.book_type,
+        Book.book_location,
+        BookInventory.total_copies,
+        BookInventory.copies_available,
+        BookInventory.status,
+        BookInventory.added_at,
+        BookAcquisition.date_received,
+        BookAcquisition.source_of_fund,
+        BookAcquisition.place,
+        BookAcquisition.publisher,
+        BookAcquisition.published_year,
+        BookAcquisition.date_copyright,
+        BookAcquisition.volume_edition,
+    )
+
     def __init__(self, db: Session):
         self.db = db
+        self.trigrams = BookTrigramRepository(db)
+        self.versions = CatalogVersionRepository(db)
 
-    def list(self) -> List[Book]:
-        return (
-            self.db.query(Book)
-            .options(
+    def list(
+        self,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        category: Optional[str] = None,
+        book_type: Optional[str] = None,
+        location: Optional[str] = None,
+        available: Optional[bool] = None,
+    ) -> List[Book]:
+        query = self.db.query(Book)
+        if fields is None:
+            query = query.options(
                 selectinload(Book.acquisition),
                 selectinload(Book.inventory),
             )
-            .all()
-        )
+        else:
+            columns = [getattr(Book, field) for field in fields if field not in self.RELATIONS]
+            relations = [self.RELATIONS[field] for field in fields if field in self.RELATIONS]
+            query = query.options(
+                load_only(*columns),
+                *(selectinload(relation) for relation in relations),
+            )
+
+        if category is not None:
+            query = query.filter(Book.category == category)
+        if book_type is not None:
+            query = query.filter(Book.book_type == book_type)
+        if location is not None:
+            query = query.filter(Book.book_location == location)
+        if available is not None:
+            in_stock = Book.inventory.has(BookInventory.copies_available > 0)
+            query = query.filter(in_stock if available else ~in_stock)
+
+        return keyset(query, Book.id, cursor, limit).all()
 
     def get(self, book_id: int) -> Optional[Book]:
         return (
@@ -47,10 +122,35 @@ class BookRepository:
             book.inventory = BookInventory(**inventory_data)
 
         self.db.add(book)
+        self.db.flush()
+        if self._stores_trigrams:
+            self.trigrams.replace(book.id, self._search_document(book))
+        self.versions.bump([book.id])
         self.db.commit()
         self.db.refresh(book)
+        catalog_events.publish([book.id])
         return book
 
+    def bulk_create(self, records: Sequence[dict]) -> Tuple[Dict[int, int], Dict[int, str]]:
+        """Insert a chunk of ``create``-style payloads in one transaction.
+
+        Returns ``(created, failed)`` keyed by position in ``records``: the new
+        book id, or the database error for rows that had to be rejected.
+        """
+        try:
+            book_ids = self._insert_books([self._book_columns(record) for record in records])
+            self._insert_children(zip(book_ids, records))
+            self.versions.bump(book_ids)
+            self.db.commit()
+        except StatementError:
+            # Any row the database or its driver rejects (duplicate isbn, over-long
+            # value, bad type) sends the chunk through the per-row path.
+            self.db.rollback()
+            return self._create_each(records)
+
+        catalog_events.publish(book_ids)
+        return dict(enumerate(book_ids)), {}
+
     def update(self, book: Book, data: dict) -> Book:
         acquisition_data = data.pop("acquisition", None)
         inventory_data = data.pop("inventory", None)
@@ -72,18 +172,158 @@ class BookRepository:
             elif inventory_data:
                 book.inventory = BookInventory(**inventory_data)
 
+        if self._stores_trigrams and any(field in data for field in TRIGRAM_FIELDS):
+            self.trigrams.replace(book.id, self._search_document(book))
+        self.versions.bump([book.id])
+
         self.db.commit()
         self.db.refresh(book)
+        catalog_events.publish([book.id])
         return book
 
     def delete(self, book: Book) -> None:
+        book_id = book.id
+        if self._stores_trigrams:
+            self.trigrams.delete(book_id)
         self.db.delete(book)
+        self.versions.bump([book_id])
+        self.db.commit()
+        catalog_events.publish([book_id])
+
+    def inventory_for_update(self, book_ids: Collection[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Lock and read the inventory counts of ``book_ids`` without loading ORM objects.
+
+        Books that have no inventory row map to ``None``; unknown ids are left out.
+        """
+        # Sorted so concurrent batches lock rows in the same order.
+        rows = self.db.execute(
+            select(
+                BookInventory.book_id,
+                BookInventory.total_copies,
+                BookInventory.copies_available,
+                BookInventory.status,
+            )
+            .where(BookInventory.book_id.in_(sorted(book_ids)))
+            .order_by(BookInventory.book_id)
+            .with_for_update()
+        )
+        found: Dict[int, Optional[Dict[str, Any]]] = {row.book_id: row._asdict() for row in rows}
+        unresolved = set(book_ids) - found.keys()
+        if unresolved:
+            found.update(
+                (book_id, None) for book_id in self.db.scalars(select(Book.id).where(Book.id.in_(unresolved)))
+            )
+        return found
+
+    def apply_inventory(self, rows: Sequence[Dict[str, Any]], new_ids: Collection[int]) -> None:
+        """Write final inventory counts for one chunk and commit; ``new_ids`` get their row inserted."""
+        if not rows:
+            # Nothing to write, but the row locks still have to be released.
+            self.db.rollback()
+            return
+        updates = [row for row in rows if row["book_id"] not in new_ids]
+        inserts = [{**self.INVENTORY_DEFAULTS, **row} for row in rows if row["book_id"] in new_ids]
+        if updates:
+            # Bulk UPDATE by primary key: one executemany for the whole chunk.
+            self.db.execute(update(BookInventory), updates)
+        if inserts:
+            self.db.execute(insert(BookInventory), inserts)
+        book_ids = [row["book_id"] for row in rows]
+        self.versions.bump(book_ids)
+        # The writes bypass the ORM, so flag the books for cache invalidation here.
+        mark_books_changed(self.db, book_ids)
         self.db.commit()
+        catalog_events.publish(book_ids)
+
+    def get_many(self, book_ids: List[int]) -> List[Book]:
+        """Load books by id, preserving the order of ``book_ids``."""
+        if not book_ids:
+            return []
+        books = (
+            self.db.query(Book)
+            .options(
+                selectinload(Book.acquisition),
+                selectinload(Book.inventory),
+            )
+            .filter(Book.id.in_(book_ids))
+            .all()
+        )
+        by_id = {book.id: book for book in books}
+        return [by_id[book_id] for book_id in book_ids if book_id in by_id]
+
+    def catch_up(self) -> None:
+        """Publish catalog changes other workers committed, so in-process structures reflect them."""
+        catalog_events.catch_up(self.versions.total(), self.versions.counters)
+
+    def mark_caught_up(self) -> None:
+        catalog_events.mark_caught_up(self.versions.counters())
+
+    def iter_export_rows(self, batch_size: int = 1000) -> Iterator[Row]:
+        """Stream flat book/inventory/acquisition rows through a server-side cursor."""
+        statement = (
+            select(*self.EXPORT_COLUMNS)
+            .outerjoin(BookInventory, BookInventory.book_id == Book.id)
+            .outerjoin(BookAcquisition, BookAcquisition.book_id == Book.id)
+            .order_by(Book.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.execute(statement)
+
+    def iter_search_documents(
+        self,
+        book_ids: Optional[Sequence[int]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Tuple[int, Dict[str, Optional[str]]]]:
+        columns = [getattr(Book, field) for field in self.SEARCH_FIELDS]
+        statement = select(Book.id, *columns)
+        if book_ids is not None:
+            statement = statement.where(Book.id.in_(book_ids))
+        rows = self.db.execute(statement.execution_options(yield_per=batch_size))
+        for row in rows:
+            yield row.id, {field: getattr(row, field) for field in self.SEARCH_FIELDS}
+
+    def rebuild_search_index(self) -> None:
+        if self.fulltext is None:
+            book_search_index.rebuild(self.iter_search_documents())
+        if self._stores_trigrams:
+            if self.trigrams.is_empty():
+                self.trigrams.backfill()
+        else:
+            book_trigram_index.rebuild(self.iter_search_documents())
+
+    def reindex(self, book_ids: Sequence[int]) -> None:
+        """Re-read ``book_ids`` into the in-process indexes in use; ids without a row are dropped."""
+        indexes = self._memory_indexes
+        if not indexes:
+            return
+        documents = dict(self.iter_search_documents(book_ids))
+        for book_id in book_ids:
+            document = documents.get(book_id)
+            for index in indexes:
+                if document is None:
+                    index.remove(book_id)
+                else:
+                    index.upsert(book_id, document)
 
     def search(self, query: str, limit: int = 20) -> List[Book]:
+        return self.get_many(self.search_ids(query, limit))
+
+    def search_ids(self, query: str, limit: int = 20) -> List[int]:
+        """Ranked ids of matching books, falling back to fuzzy title/author matches."""
         terms = [term for term in query.split() if term]
         if not terms:
             return []
+        if self._memory_indexes:
+            self.catch_up()
+
+        if self.fulltext is not None:
+            statement = self.fulltext.statement(query, limit)
+            book_ids = list(self.db.scalars(statement)) if statement is not None else []
+            return book_ids or self._fuzzy_ids(query, limit)
+
+        if book_search_index.ready:
+            book_ids = book_search_index.search(query, limit)
+            return book_ids or self._fuzzy_ids(query, limit)
 
         clauses = []
         for term in terms:
@@ -102,37 +342,136 @@ class BookRepository:
         pattern = f"%{query}%"
         title_priority = case((Book.title.ilike(pattern), 0), else_=1)
 
-        results = (
-            self.db.query(Book)
-            .options(
-                selectinload(Book.acquisition),
-                selectinload(Book.inventory),
+        book_ids = list(
+            self.db.scalars(
+                select(Book.id)
+                .where(or_(*clauses))
+                .order_by(title_priority, Book.id)
+                .limit(limit)
             )
-            .filter(or_(*clauses))
-            .order_by(title_priority, Book.id)
-            .limit(limit)
-            .all()
         )
+        return book_ids or self._fuzzy_ids(query, limit)
 
-        if results:
-            return results
-
-        candidates = (
-            self.db.query(Book)
-            .options(
-                selectinload(Book.acquisition),
-                selectinload(Book.inventory),
+    def iter_rollup_rows(self, book_ids: Optional[Sequence[int]] = None) -> Iterator[Row]:
+        """Copy-level rows for the title/author rollup, optionally limited to ``book_ids``."""
+        statement = (
+            select(
+                Book.id,
+                Book.title,
+                Book.author,
+                Book.call_numbers,
+                Book.book_location,
+                Book.book_type,
+                BookInventory.total_copies,
+                BookInventory.copies_available,
+                BookInventory.status,
             )
-            .limit(100)
-            .all()
+            .outerjoin(BookInventory, BookInventory.book_id == Book.id)
+            .order_by(Book.id)
         )
+        if book_ids is not None:
+            statement = statement.where(Book.id.in_(book_ids))
+        yield from self.db.execute(statement.execution_options(yield_per=1000))
+
+    def _fuzzy_ids(self, query: str, limit: int) -> List[int]:
+        if self._stores_trigrams:
+            return self.trigrams.search(query, limit)
+        if not book_trigram_index.ready:
+            book_trigram_index.rebuild(self.iter_search_documents())
+        return book_trigram_index.search(query, limit)
+
+    def _create_each(self, records: Sequence[dict]) -> Tuple[Dict[int, int], Dict[int, str]]:
+        created: Dict[int, int] = {}
+        failed: Dict[int, str] = {}
+        for position, record in enumerate(records):
+            try:
+                with self.db.begin_nested():
+                    [book_id] = self._insert_books([self._book_columns(record)])
+                    self._insert_children([(book_id, record)])
+            except StatementError as exc:
+                failed[position] = str(exc.orig)
+                continue
+            created[position] = book_id
+        if created:
+            self.versions.bump(created.values())
+        self.db.commit()
+        catalog_events.publish(created.values())
+        return created, failed
+
+    def _insert_books(self, rows: List[Dict[str, Any]]) -> List[int]:
+        dialect = self.db.get_bind().dialect
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            statement = insert(Book).returning(Book.id, sort_by_parameter_order=True)
+            return list(self.db.scalars(statement, rows))
+        if dialect.name == "mysql":
+            return self._insert_books_multirow(rows)
+        # Without RETURNING or a known id sequence, ids come back one statement at a
+        # time; everything still shares the chunk's transaction.
+        return [
+            self.db.execute(insert(Book).values(**row)).inserted_primary_key[0]
+            for row in rows
+        ]
+
+    def _insert_books_multirow(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """One multi-row INSERT on MySQL, with the ids worked out from ``LAST_INSERT_ID()``.
+
+        A multi-row ``VALUES`` insert that leaves ``id`` to the table is a "simple
+        insert" to InnoDB: in every ``innodb_autoinc_lock_mode`` it reserves the
+        statement's ids in one block, so they run from the first id reported,
+        ``auto_increment_increment`` apart.
+        """
+        result = self.db.execute(insert(Book).values(rows))
+        first_id = result.lastrowid
+        step = self._auto_increment_step()
+        return [first_id + position * step for position in range(len(rows))]
+
+    def _auto_increment_step(self) -> int:
+        connection = self.db.connection()
+        # A session variable, so it is read once per pooled connection.
+        step = connection.info.get(AUTO_INCREMENT_STEP_KEY)
+        if step is None:
+            step = int(connection.exec_driver_sql("SELECT @@auto_increment_increment").scalar())
+            connection.info[AUTO_INCREMENT_STEP_KEY] = step
+        return step
+
+    def _insert_children(self, records: Iterable[Tuple[int, dict]]) -> None:
+        acquisitions = []
+        inventories = []
+        documents = []
+        for book_id, record in records:
+            if record.get("acquisition"):
+                acquisitions.append({**self.ACQUISITION_DEFAULTS, **record["acquisition"], "book_id": book_id})
+            if record.get("inventory"):
+                inventories.append({**self.INVENTORY_DEFAULTS, **record["inventory"], "book_id": book_id})
+            documents.append((book_id, self._book_columns(record)))
+
+        if acquisitions:
+            self.db.execute(insert(BookAcquisition), acquisitions)
+        if inventories:
+            self.db.execute(insert(BookInventory), inventories)
+        if self._stores_trigrams:
+            self.trigrams.insert_many(documents)
+
+    def _book_columns(self, record: Mapping[str, Any]) -> Dict[str, Any]:
+        return {column: record.get(column) for column in self.BOOK_COLUMNS}
+
+    @property
+    def fulltext(self) -> Optional[FullTextSearch]:
+        return get_fulltext_search(self.db.get_bind().dialect.name)
+
+    @property
+    def _stores_trigrams(self) -> bool:
+        return self.db.get_bind().dialect.name == "mysql"
 
-        scored = []
-        lowered_query = query.lower()
-        for book in candidates:
-            ratio = SequenceMatcher(None, book.title.lower(), lowered_query).ratio()
-            if ratio >= 0.6:
-                scored.append((ratio, book))
+    @property
+    def _memory_indexes(self) -> List[Union[BookSearchIndex, TrigramIndex]]:
+        """The built in-process indexes this database's searches read from."""
+        indexes: List[Union[BookSearchIndex, TrigramIndex]] = []
+        if self.fulltext is None and book_search_index.ready:
+            indexes.append(book_search_index)
+        if not self._stores_trigrams and book_trigram_index.ready:
+            indexes.append(book_trigram_index)
+        return indexes
 
-        scored.sort(key=lambda item: item[0], reverse=True)
-        return [book for _, book in scored[:limit]]
+    def _search_document(self, book: Book) -> Dict[str, Optional[str]]:
+        return {field: getattr(book, field) for field in self.SEARCH_FIELDS}
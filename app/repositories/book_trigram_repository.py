@@ -0,0 +1,108 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.trigram_index import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    TRIGRAM_FIELDS,
+    jaccard,
+    trigrams,
+)
+from app.models.book import Book
+from app.models.book_trigram import BookTrigram
+
+
+class BookTrigramRepository:
+    """Trigram rows stored alongside ``books`` for fuzzy matching on MySQL."""
+
+    CANDIDATE_FACTOR = 5
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def replace(self, book_id: int, fields: Mapping[str, Optional[str]]) -> None:
+        """Stage the trigram rows for one book; the caller owns the commit."""
+        self.db.execute(delete(BookTrigram).where(BookTrigram.book_id == book_id))
+        rows = [
+            {"trigram": gram, "book_id": book_id, "field": field}
+            for field in TRIGRAM_FIELDS
+            for gram in trigrams(fields.get(field))
+        ]
+        if rows:
+            self.db.execute(insert(BookTrigram), rows)
+
+    def insert_many(self, documents: Iterable[Tuple[int, Mapping[str, Optional[str]]]]) -> None:
+        """Stage trigram rows for freshly inserted books in one executemany."""
+        rows = [
+            {"trigram": gram, "book_id": book_id, "field": field}
+            for book_id, fields in documents
+            for field in TRIGRAM_FIELDS
+            for gram in trigrams(fields.get(field))
+        ]
+        if rows:
+            self.db.execute(insert(BookTrigram), rows)
+
+    def delete(self, book_id: int) -> None:
+        self.db.execute(delete(BookTrigram).where(BookTrigram.book_id == book_id))
+
+    def is_empty(self) -> bool:
+        return self.db.execute(select(BookTrigram.book_id).limit(1)).first() is None
+
+    def backfill(self, batch_size: int = 1000) -> None:
+        rows = self.db.execute(
+            select(Book.id, Book.title, Book.author).execution_options(yield_per=batch_size)
+        )
+        pending = []
+        for row in rows:
+            for field in TRIGRAM_FIELDS:
+                pending.extend(
+                    {"trigram": gram, "book_id": row.id, "field": field}
+                    for gram in trigrams(getattr(row, field))
+                )
+            if len(pending) >= batch_size:
+                self.db.execute(insert(BookTrigram), pending)
+                pending = []
+        if pending:
+            self.db.execute(insert(BookTrigram), pending)
+        self.db.commit()
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> List[int]:
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        shared = func.count().label("shared")
+        candidates = self.db.execute(
+            select(BookTrigram.book_id, BookTrigram.field, shared)
+            .where(BookTrigram.trigram.in_(query_grams))
+            .group_by(BookTrigram.book_id, BookTrigram.field)
+            .order_by(shared.desc())
+            .limit(limit * self.CANDIDATE_FACTOR)
+        ).all()
+        if not candidates:
+            return []
+
+        sizes: Dict[Tuple[int, str], int] = {
+            (row.book_id, row.field): row.size
+            for row in self.db.execute(
+                select(BookTrigram.book_id, BookTrigram.field, func.count().label("size"))
+                .where(BookTrigram.book_id.in_({row.book_id for row in candidates}))
+                .group_by(BookTrigram.book_id, BookTrigram.field)
+            )
+        }
+
+        best: Dict[int, float] = defaultdict(float)
+        for row in candidates:
+            score = jaccard(row.shared, len(query_grams), sizes[(row.book_id, row.field)])
+            if score >= threshold:
+                best[row.book_id] = max(best[row.book_id], score)
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+        return [book_id for book_id, _ in ranked[:limit]]
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from typing import Collection, Dict, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.catalog_version import CatalogVersion
+
+
+class CatalogStamp(NamedTuple):
+    """Catalog-wide validator derived from the per-book counters."""
+
+    version: int
+    updated_at: datetime
+
+
+class CatalogVersionRepository:
+    """Version counters bumped in the same transaction as the catalog change they describe."""
+
+    UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, book_id: int) -> Optional[CatalogVersion]:
+        return self.db.get(CatalogVersion, book_id)
+
+    def counters(self, book_ids: Optional[Collection[int]] = None) -> Dict[int, int]:
+        """Current version of each of ``book_ids`` (default: every book) changed at least once."""
+        statement = select(CatalogVersion.book_id, CatalogVersion.version)
+        if book_ids is not None:
+            statement = statement.where(CatalogVersion.book_id.in_(book_ids))
+        return {row.book_id: row.version for row in self.db.execute(statement)}
+
+    def total(self) -> int:
+        """Sum of every counter; it moves whenever any book changes."""
+        return int(self.db.scalar(select(func.coalesce(func.sum(CatalogVersion.version), 0))))
+
+    def catalog(self) -> Optional[CatalogStamp]:
+        """Sum and latest change time of the per-book counters, or None before the first change.
+
+        Every bump raises the sum, so it versions the whole catalog without a
+        shared row that every write would have to lock.
+        """
+        total, updated_at = self.db.execute(
+            select(func.sum(CatalogVersion.version), func.max(CatalogVersion.updated_at))
+        ).one()
+        if total is None:
+            return None
+        return CatalogStamp(int(total), updated_at)
+
+    def bump(self, book_ids: Iterable[int]) -> None:
+        """Stage an increment for each of ``book_ids``; the caller owns the commit."""
+        # Sorted so concurrent writers lock rows in the same order.
+        keys = sorted(set(book_ids))
+        if not keys:
+            return
+        # Last-Modified has one-second resolution.
+        now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        rows = [{"book_id": key, "version": 1, "updated_at": now} for key in keys]
+        table = CatalogVersion.__table__
+        dialect = self.db.get_bind().dialect.name
+
+        if dialect == "mysql":
+            statement = mysql.insert(table)
+            statement = statement.on_duplicate_key_update(
+                version=table.c.version + 1,
+                updated_at=statement.inserted.updated_at,
+            )
+        elif dialect in self.UPSERT_INSERTS:
+            statement = self.UPSERT_INSERTS[dialect](table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.book_id],
+                set_={"version": table.c.version + 1, "updated_at": statement.excluded.updated_at},
+            )
+        else:
+            self._bump_portable(keys, now)
+            return
+        self.db.execute(statement, rows)
+
+    def _bump_portable(self, keys: List[int], now: datetime) -> None:
+        self.db.execute(
+            update(CatalogVersion)
+            .where(CatalogVersion.book_id.in_(keys))
+            .values(version=CatalogVersion.version + 1, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        existing = set(self.db.scalars(select(CatalogVersion.book_id).where(CatalogVersion.book_id.in_(keys))))
+        missing = [{"book_id": key, "version": 1, "updated_at": now} for key in keys if key not in existing]
+        if missing:
+            self.db.execute(insert(CatalogVersion), missing)
@@ -1,16 +1,25 @@
 from typing import Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.models.librarian import Librarian
+from app.repositories.pagination import keyset
 
 
 class LibrarianRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def list(self) -> Sequence[Librarian]:
-        return self.db.query(Librarian).all()
+    def list(
+        self,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Sequence[Librarian]:
+        query = self.db.query(Librarian)
+        if fields is not None:
+            query = query.options(load_only(*(getattr(Librarian, field) for field in fields)))
+        return keyset(query, Librarian.id, cursor, limit).all()
 
     def get(self, librarian_id: int) -> Optional[Librarian]:
         return (
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from sqlalchemy.orm import Query
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+
+def keyset(
+    query: Query,
+    key: InstrumentedAttribute,
+    cursor: Optional[int],
+    limit: Optional[int],
+) -> Query:
+    """Order by ``key`` and resume after ``cursor``; fetches one extra row so callers can tell if more remain."""
+    if cursor is not None:
+        query = query.filter(key > cursor)
+    query = query.order_by(key)
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
@@ -0,0 +1,126 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+
+from app.core import catalog_events
+from app.core.book_cache import mark_books_changed
+from app.models.book import Book, BookStatus
+from app.models.book_inventory import BookInventory
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.repositories.catalog_version_repository import CatalogVersionRepository
+
+
+class TransactionRepository:
+    """Circulation writes: each checkout/return is one conditional UPDATE plus one INSERT."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.versions = CatalogVersionRepository(db)
+
+    def borrow(self, book_id: int, user_id: int) -> Optional[Transaction]:
+        """Take one copy, or return ``None`` (after rolling back) when none is available."""
+        # status is assigned first: MySQL evaluates SET clauses left to right
+        # against the updated row, other backends against the original one.
+        statement = (
+            update(BookInventory)
+            .where(
+                BookInventory.book_id == book_id,
+                BookInventory.copies_available > 0,
+            )
+            .ordered_values(
+                (
+                    BookInventory.status,
+                    case(
+                        (BookInventory.copies_available > 1, BookStatus.AVAILABLE.value),
+                        else_=BookStatus.BORROWED.value,
+                    ),
+                ),
+                (BookInventory.copies_available, BookInventory.copies_available - 1),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return self._record(statement, book_id, user_id, "borrow")
+
+    def return_book(self, book_id: int, user_id: int) -> Optional[Transaction]:
+        """Put one copy back, or return ``None`` (after rolling back) when every copy is already in."""
+        statement = (
+            update(BookInventory)
+            .where(
+                BookInventory.book_id == book_id,
+                BookInventory.copies_available < BookInventory.total_copies,
+            )
+            .ordered_values(
+                (BookInventory.status, BookStatus.AVAILABLE.value),
+                (BookInventory.copies_available, BookInventory.copies_available + 1),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return self._record(statement, book_id, user_id, "return")
+
+    def close_loan(self, book_id: int, user_id: int) -> bool:
+        """Mark the user's oldest open borrow of ``book_id`` returned, or return ``False`` (after rolling back).
+
+        The conditional UPDATE is the claim: when two returns race for the same
+        loan only one changes the row, and the other moves on to the next loan.
+        """
+        returned_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        claimed: List[int] = []
+        while True:
+            loan_id = self.db.execute(
+                select(Transaction.id)
+                .where(
+                    Transaction.book_id == book_id,
+                    Transaction.user_id == user_id,
+                    Transaction.type == "borrow",
+                    Transaction.status == "done",
+                    Transaction.returned_at.is_(None),
+                    Transaction.id.not_in(claimed),
+                )
+                .order_by(Transaction.id)
+                .limit(1)
+            ).scalar()
+            if loan_id is None:
+                self.db.rollback()
+                return False
+            statement = (
+                update(Transaction)
+                .where(Transaction.id == loan_id, Transaction.returned_at.is_(None))
+                .values(returned_at=returned_at)
+                .execution_options(synchronize_session=False)
+            )
+            if self.db.execute(statement).rowcount == 1:
+                return True
+            claimed.append(loan_id)
+
+    def book_exists(self, book_id: int) -> bool:
+        return self.db.execute(select(Book.id).where(Book.id == book_id)).first() is not None
+
+    def user_exists(self, user_id: int) -> bool:
+        return self.db.execute(select(User.id).where(User.id == user_id)).first() is not None
+
+    def get_inventory(self, book_id: int) -> Optional[BookInventory]:
+        return self.db.get(BookInventory, book_id)
+
+    def _record(self, statement, book_id: int, user_id: int, kind: str) -> Optional[Transaction]:
+        if self.db.execute(statement).rowcount != 1:
+            self.db.rollback()
+            return None
+
+        transaction = Transaction(
+            book_id=book_id,
+            user_id=user_id,
+            type=kind,
+            status="done",
+            timestamp=datetime.now(timezone.utc).replace(tzinfo=None),
+        )
+        self.db.add(transaction)
+        self.versions.bump([book_id])
+        # The inventory UPDATE bypasses the ORM, so flag the book for cache invalidation here.
+        mark_books_changed(self.db, [book_id])
+        self.db.commit()
+        self.db.refresh(transaction)
+        catalog_events.publish([book_id])
+        return transaction
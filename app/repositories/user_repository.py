@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session, load_only
 
-from app.models.user import User
+from app.models.user import User, UserRole
+from app.repositories.pagination import keyset
 
 
 class UserRepository:
@@ -11,8 +13,27 @@ class UserRepository:
     def __init__(self, db: Session):
         self.session = db
 
-    def list(self) -> List[User]:
-        return self.session.query(User).all()
+    def list(
+        self,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        role: Optional[UserRole] = None,
+    ) -> List[User]:
+        query = self.session.query(User)
+        if fields is not None:
+            query = query.options(load_only(*(getattr(User, field) for field in fields)))
+        if role is not None:
+            query = query.filter(User.role == role)
+        return keyset(query, User.id, cursor, limit).all()
+
+    def iter_export_rows(self, batch_size: int = 1000) -> Iterator[Row]:
+        statement = (
+            select(*User.__table__.columns)
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.session.execute(statement)
 
     def get(self, user_id: int) -> Optional[User]:
         return (
@@ -21,6 +42,14 @@ class UserRepository:
             .first()
         )
 
+    def get_many(self, user_ids: Sequence[int]) -> List[User]:
+        """Load users by id in one query, preserving the order of ``user_ids``."""
+        if not user_ids:
+            return []
+        users = self.session.scalars(select(User).where(User.id.in_(user_ids)))
+        by_id = {user.id: user for user in users}
+        return [by_id[user_id] for user_id in user_ids if user_id in by_id]
+
     def create(self, data: dict) -> User:
         user = User(**data)
         self.session.add(user)
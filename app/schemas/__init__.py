@@ -4,6 +4,7 @@ from app.schemas.librarian import (  # noqa: F401
     LibrarianRead,
     LibrarianUpdate,
 )
+from app.schemas.pagination import Batch, Page  # noqa: F401
 from app.schemas.user import UserCreate, UserRead, UserUpdate  # noqa: F401
 
 __all__ = [
@@ -16,4 +17,6 @@ __all__ = [
     "LibrarianCreate",
     "LibrarianRead",
     "LibrarianUpdate",
+    "Batch",
+    "Page",
 ]
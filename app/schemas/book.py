@@ -1,7 +1,7 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from app.models.book import BookStatus
 
@@ -77,3 +77,75 @@ class BookRead(BookBase):
     inventory: Optional[BookInventoryRead] = None
 
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+
+class BookImportError(BaseModel):
+    row: int
+    error: str
+
+
+class BookImportProgress(BaseModel):
+    processed: int = 0
+    inserted: int = 0
+    failed: int = 0
+    errors: List[BookImportError] = []
+    done: bool = False
+
+
+class InventoryAdjustment(BaseModel):
+    """One stocktaking change: each count is either set outright or moved by a delta."""
+
+    book_id: int
+    total_copies: Optional[int] = None
+    total_copies_delta: Optional[int] = None
+    copies_available: Optional[int] = None
+    copies_available_delta: Optional[int] = None
+    # When omitted, status follows copies_available the way checkouts and returns set it.
+    status: Optional[BookStatus] = None
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    @model_validator(mode="after")
+    def check_changes(self) -> "InventoryAdjustment":
+        if self.total_copies is not None and self.total_copies_delta is not None:
+            raise ValueError("give total_copies or total_copies_delta, not both")
+        if self.copies_available is not None and self.copies_available_delta is not None:
+            raise ValueError("give copies_available or copies_available_delta, not both")
+        if not self.model_fields_set - {"book_id"}:
+            raise ValueError("no inventory change given")
+        return self
+
+
+class InventoryAdjustmentResult(BaseModel):
+    book_id: int
+    updated: bool
+    total_copies: Optional[int] = None
+    copies_available: Optional[int] = None
+    status: Optional[BookStatus] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(use_enum_values=True)
+
+
+class InventoryBatchResult(BaseModel):
+    updated: int = 0
+    failed: int = 0
+    results: List[InventoryAdjustmentResult] = []
+
+
+class WorkRead(BaseModel):
+    title: str
+    author: str
+    total_copies: int
+    available_copies: int
+    call_numbers: List[str]
+    location: str
+    book_type: str
+    status: str
+
+
+class WorkPage(BaseModel):
+    """Works in title order; ``next_cursor`` is the key of the last work on the page."""
+
+    items: List[WorkRead]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,28 @@
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Most ids one batch fetch may resolve; they all go into a single IN (...).
+MAX_BATCH_IDS = 200
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[int] = None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any], limit: int, serialize: Callable[[Any], T]) -> "Page[T]":
+        """Build a page from ``limit + 1`` rows fetched in ``id`` order."""
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = rows[-1].id if has_more and rows else None
+        return cls(items=[serialize(row) for row in rows], next_cursor=next_cursor)
+
+
+class Batch(BaseModel, Generic[T]):
+    """Rows fetched by id, in request order, plus the requested ids that do not exist."""
+
+    items: List[T]
+    not_found: List[int] = []
@@ -13,3 +13,14 @@ class TransactionResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class CirculationRequest(BaseModel):
+    book_id: int
+    user_id: int
+
+
+class CirculationResponse(BaseModel):
+    transaction: TransactionResponse
+    copies_available: int
+    status: str
@@ -1,8 +1,9 @@
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, model_validator
+from pydantic import BaseModel, EmailStr, Field, model_validator
 
 from app.models.user import UserRole
+from app.schemas.pagination import MAX_BATCH_IDS
 
 
 class UserBase(BaseModel):
@@ -50,3 +51,7 @@ class UserRead(UserBase):
 
     class Config:
         from_attributes = True
+
+
+class UserBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
@@ -1,9 +1,41 @@
-from typing import List, Optional
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
+from app.core import catalog_events
+from app.core.book_cache import get_book_read_cache, track_session_changes
+from app.core.database import SessionLocal
+from app.models.book import Book, BookStatus
+from app.models.book_acquisition import BookAcquisition
+from app.models.book_inventory import BookInventory
+from app.models.catalog_version import CatalogVersion
 from app.repositories.book_repository import BookRepository
-from app.schemas.book import BookCreate, BookRead, BookUpdate
+from app.repositories.catalog_version_repository import CatalogStamp
+from app.schemas.book import (
+    BookAcquisitionCreate,
+    BookAcquisitionRead,
+    BookCreate,
+    BookImportError,
+    BookImportProgress,
+    BookInventoryCreate,
+    BookInventoryRead,
+    BookRead,
+    BookUpdate,
+    InventoryAdjustment,
+    InventoryAdjustmentResult,
+    InventoryBatchResult,
+)
+from app.schemas.export import ExportFormat
+from app.schemas.pagination import Batch, Page
+from app.services.export import encode_rows
+
+book_cache = get_book_read_cache()
+if book_cache is not None:
+    track_session_changes(book_cache, {Book: "id", BookInventory: "book_id", BookAcquisition: "book_id"})
 
 
 class BookService:
@@ -11,22 +43,156 @@ class BookService:
 
     def __init__(self, db: Session):
         self.repository = BookRepository(db)
+        self.cache = book_cache
+
+    RELATION_SCHEMAS = {"acquisition": BookAcquisitionRead, "inventory": BookInventoryRead}
+    NESTED_IMPORT_FIELDS = {
+        "acquisition": tuple(BookAcquisitionCreate.model_fields),
+        "inventory": tuple(BookInventoryCreate.model_fields),
+    }
+
+    def list_books(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        category: Optional[str] = None,
+        book_type: Optional[str] = None,
+        location: Optional[str] = None,
+        available: Optional[bool] = None,
+    ) -> Page:
+        books = self.repository.list(
+            cursor=cursor,
+            limit=limit,
+            fields=fields,
+            category=category,
+            book_type=book_type,
+            location=location,
+            available=available,
+        )
+        if fields is None:
+            return Page[BookRead].from_rows(books, limit, BookRead.model_validate)
+        return Page[Dict[str, Any]].from_rows(
+            books, limit, lambda book: self._select_fields(book, fields)
+        )
 
-    def list_books(self) -> List[BookRead]:
-        books = self.repository.list()
-        return [BookRead.model_validate(book) for book in books]
+    def export_books(self, export_format: ExportFormat) -> Iterator[str]:
+        columns = [column.key for column in self.repository.EXPORT_COLUMNS]
+        return encode_rows(export_format, columns, self.repository.iter_export_rows())
+
+    def catalog_version(self, book_id: Optional[int] = None) -> Optional[Union[CatalogVersion, CatalogStamp]]:
+        """The change counter for one book, or for the whole catalog when ``book_id`` is omitted."""
+        if book_id is None:
+            return self.repository.versions.catalog()
+        return self.repository.versions.get(book_id)
+
+    def get_book(self, book_id: int, version: Optional[CatalogVersion] = None) -> Optional[BookRead]:
+        """Load one book; ``version`` is the row already read for its ETag, fetched here when omitted."""
+        if self.cache is None:
+            book = self.repository.get(book_id)
+            return BookRead.model_validate(book) if book else None
+
+        if version is None:
+            version = self.catalog_version(book_id)
+        # Books never changed through the API have no row yet.
+        counter = version.version if version is not None else 0
+        cached = self.cache.get(book_id, counter)
+        if cached is not None:
+            return cached
 
-    def get_book(self, book_id: int) -> Optional[BookRead]:
         book = self.repository.get(book_id)
         if not book:
             return None
-        return BookRead.model_validate(book)
+        result = BookRead.model_validate(book)
+        self.cache.set(book_id, counter, result)
+        return result
+
+    def get_books(self, book_ids: List[int], fields: Optional[Sequence[str]] = None) -> Batch:
+        """Resolve ``book_ids`` in request order; books cached at their current version skip the load."""
+        found: Dict[int, BookRead] = {}
+        counters: Dict[int, int] = {}
+        if self.cache is not None:
+            counters = self.repository.versions.counters(book_ids)
+            for book_id in book_ids:
+                cached = self.cache.get(book_id, counters.get(book_id, 0))
+                if cached is not None:
+                    found[book_id] = cached
+
+        for book in self.repository.get_many([book_id for book_id in book_ids if book_id not in found]):
+            result = BookRead.model_validate(book)
+            found[book.id] = result
+            if self.cache is not None:
+                self.cache.set(book.id, counters.get(book.id, 0), result)
+
+        items = [found[book_id] for book_id in book_ids if book_id in found]
+        not_found = [book_id for book_id in book_ids if book_id not in found]
+        if fields is None:
+            return Batch[BookRead](items=items, not_found=not_found)
+        return Batch[Dict[str, Any]](
+            items=[item.model_dump(include=set(fields)) for item in items], not_found=not_found
+        )
 
     def create_book(self, dto: BookCreate) -> BookRead:
         payload = dto.model_dump(exclude_none=True)
         book = self.repository.create(payload)
         return BookRead.model_validate(book)
 
+    def parse_import(self, body: bytes, content_type: str) -> List[Any]:
+        """Decode a CSV or JSON-array upload; flat acquisition/inventory columns are nested."""
+        if "csv" in content_type:
+            rows = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+            return [self._nest_import_row(row) for row in rows]
+
+        data = json.loads(body)
+        if not isinstance(data, list):
+            raise ValueError("Expected a JSON array of books")
+        return [self._nest_import_row(row) if isinstance(row, dict) else row for row in data]
+
+    def import_books(self, records: Sequence[Any], chunk_size: int) -> Iterator[BookImportProgress]:
+        """Validate and insert ``records`` chunk by chunk, yielding progress after each chunk."""
+        if not records:
+            yield BookImportProgress(done=True)
+            return
+        inserted = failed = 0
+        for start in range(0, len(records), chunk_size):
+            chunk = records[start : start + chunk_size]
+            errors: List[BookImportError] = []
+            payloads: List[dict] = []
+            row_numbers: List[int] = []
+            for row_number, record in enumerate(chunk, start=start + 1):
+                try:
+                    dto = BookCreate.model_validate(record)
+                except ValidationError as exc:
+                    errors.append(BookImportError(row=row_number, error=self._describe(exc)))
+                    continue
+                payloads.append(dto.model_dump(exclude_none=True))
+                row_numbers.append(row_number)
+
+            created, rejected = self.repository.bulk_create(payloads) if payloads else ({}, {})
+            errors.extend(
+                BookImportError(row=row_numbers[position], error=error)
+                for position, error in rejected.items()
+            )
+            errors.sort(key=lambda error: error.row)
+            inserted += len(created)
+            failed += len(errors)
+            yield BookImportProgress(
+                processed=start + len(chunk),
+                inserted=inserted,
+                failed=failed,
+                errors=errors,
+                done=start + chunk_size >= len(records),
+            )
+
+    def collect_import(self, batches: Iterable[BookImportProgress]) -> BookImportProgress:
+        result = BookImportProgress(done=True)
+        for batch in batches:
+            result.processed = batch.processed
+            result.inserted = batch.inserted
+            result.failed = batch.failed
+            result.errors.extend(batch.errors)
+        return result
+
     def update_book(
         self,
         book_id: int,
@@ -39,9 +205,113 @@ class BookService:
         updated = self.repository.update(book, data)
         return BookRead.model_validate(updated)
 
+    def adjust_inventory(
+        self,
+        adjustments: Sequence[InventoryAdjustment],
+        chunk_size: int,
+    ) -> InventoryBatchResult:
+        """Apply stocktaking changes chunk by chunk, one transaction per chunk.
+
+        Items are applied in order, so repeated ids see each other's changes. An
+        item that would leave the counts invalid is reported and skipped; the rest
+        of its chunk is still written.
+        """
+        result = InventoryBatchResult()
+        for start in range(0, len(adjustments), chunk_size):
+            chunk = adjustments[start : start + chunk_size]
+            current = self.repository.inventory_for_update({item.book_id for item in chunk})
+            pending: Dict[int, Dict[str, Any]] = {}
+            for item in chunk:
+                outcome = self._adjust(item, current, pending)
+                result.results.append(outcome)
+                if outcome.updated:
+                    result.updated += 1
+                else:
+                    result.failed += 1
+            new_ids = {book_id for book_id in pending if current[book_id] is None}
+            self.repository.apply_inventory(list(pending.values()), new_ids)
+        return result
+
     def delete_book(self, book_id: int) -> bool:
         book = self.repository.get(book_id)
         if not book:
             return False
         self.repository.delete(book)
         return True
+
+    @staticmethod
+    def _adjust(
+        item: InventoryAdjustment,
+        current: Dict[int, Optional[Dict[str, Any]]],
+        pending: Dict[int, Dict[str, Any]],
+    ) -> InventoryAdjustmentResult:
+        if item.book_id not in current:
+            return InventoryAdjustmentResult(book_id=item.book_id, updated=False, error="Book not found")
+
+        state = pending.get(item.book_id) or current[item.book_id] or {"total_copies": 0, "copies_available": 0}
+        total = item.total_copies
+        if total is None:
+            total = state["total_copies"] + (item.total_copies_delta or 0)
+        available = item.copies_available
+        if available is None:
+            available = state["copies_available"] + (item.copies_available_delta or 0)
+
+        error = None
+        if total < 0 or available < 0:
+            error = "Copy counts cannot be negative"
+        elif available > total:
+            error = "copies_available cannot exceed total_copies"
+        if error is not None:
+            return InventoryAdjustmentResult(book_id=item.book_id, updated=False, error=error)
+
+        status = item.status or (BookStatus.AVAILABLE if available > 0 else BookStatus.BORROWED).value
+        pending[item.book_id] = {
+            "book_id": item.book_id,
+            "total_copies": total,
+            "copies_available": available,
+            "status": status,
+        }
+        return InventoryAdjustmentResult(
+            book_id=item.book_id,
+            updated=True,
+            total_copies=total,
+            copies_available=available,
+            status=status,
+        )
+
+    def _select_fields(self, book: Book, fields: Sequence[str]) -> Dict[str, Any]:
+        data = {}
+        for field in fields:
+            value = getattr(book, field)
+            schema = self.RELATION_SCHEMAS.get(field)
+            if schema is not None and value is not None:
+                value = schema.model_validate(value)
+            data[field] = value
+        return data
+
+    def _nest_import_row(self, row: Dict[Optional[str], Any]) -> Dict[str, Any]:
+        # csv.DictReader keys surplus cells under None and reports blank cells as "".
+        record = {key: value for key, value in row.items() if key is not None and value != ""}
+        for relation, fields in self.NESTED_IMPORT_FIELDS.items():
+            nested = {field: record.pop(field) for field in fields if field in record}
+            if nested and isinstance(record.get(relation, {}), dict):
+                record[relation] = {**record.get(relation, {}), **nested}
+        return record
+
+    @staticmethod
+    def _describe(exc: ValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+            for error in exc.errors()
+        )
+
+
+def refresh_search_index(book_ids: List[int]) -> None:
+    db = SessionLocal()
+    try:
+        BookRepository(db).reindex(book_ids)
+    finally:
+        db.close()
+
+
+catalog_events.subscribe(refresh_search_index)
@@ -0,0 +1,147 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from html import escape
+from typing import Any, List, Tuple
+
+from app.core.config import Settings, get_settings
+
+TABLE_STYLES = ("inline", "compact")
+
+_CELL = "padding: 8px; border: 1px solid #dee2e6;"
+_HEAD = f"{_CELL} font-weight: bold; color: #495057;"
+
+INLINE_TABLE_OPEN = (
+    '<div style="margin-top: 15px;">'
+    '<h4 style="margin-bottom: 10px; color: #1a2134; font-weight: bold;">Available Books:</h4>'
+    '<table style="width: 100%; border-collapse: collapse; font-size: 12px; background-color: #fff;">'
+    '<thead><tr style="background-color: #f8f9fa; border-bottom: 2px solid #dee2e6;">'
+    f'<th style="{_HEAD} text-align: left;">Title</th>'
+    f'<th style="{_HEAD} text-align: left;">Author</th>'
+    f'<th style="{_HEAD} text-align: center;">Available</th>'
+    f'<th style="{_HEAD} text-align: center;">Status</th>'
+    f'<th style="{_HEAD} text-align: left;">Call Numbers</th>'
+    "</tr></thead><tbody>"
+)
+INLINE_ROW = (
+    '<tr style="border-bottom: 1px solid #dee2e6;">'
+    f'<td style="{_CELL} color: #212529;"><strong>{{title}}</strong></td>'
+    f'<td style="{_CELL} color: #6c757d;">{{author}}</td>'
+    f'<td style="{_CELL} text-align: center; color: #212529;"><strong>{{available}}/{{total}}</strong></td>'
+    f'<td style="{_CELL} text-align: center; color: {{status_color}}; font-weight: bold;">{{status}}</td>'
+    f'<td style="{_CELL} color: #6c757d; font-size: 10px;">{{call_numbers}}</td>'
+    "</tr>"
+)
+
+# Class-only markup; the client stylesheet supplies the look.
+COMPACT_TABLE_OPEN = (
+    '<div class="lms-books"><h4>Available Books:</h4><table>'
+    "<thead><tr><th>Title</th><th>Author</th><th>Available</th><th>Status</th><th>Call Numbers</th></tr></thead>"
+    "<tbody>"
+)
+COMPACT_ROW = (
+    "<tr><td><strong>{title}</strong></td><td>{author}</td>"
+    "<td><strong>{available}/{total}</strong></td>"
+    '<td class="{status_class}">{status}</td><td>{call_numbers}</td></tr>'
+)
+
+TABLE_CLOSE = "</tbody></table></div>"
+
+# title, author, available, total, status, call numbers
+RowFields = Tuple[str, str, int, int, str, Tuple[str, ...]]
+
+
+class BooksTableRenderer:
+    """Renders the assistant's book table, reusing escaped row fragments per book group."""
+
+    def __init__(self, style: str = "inline", cache_size: int = 1024) -> None:
+        if style not in TABLE_STYLES:
+            raise ValueError(f"Unknown table style {style!r}; expected one of {', '.join(TABLE_STYLES)}")
+        self.style = style
+        self.cache_size = cache_size
+        self._open = INLINE_TABLE_OPEN if style == "inline" else COMPACT_TABLE_OPEN
+        self._row = INLINE_ROW if style == "inline" else COMPACT_ROW
+        self._rows: "OrderedDict[RowFields, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "BooksTableRenderer":
+        return cls(style=settings.assistant_table_style, cache_size=settings.assistant_table_cache_size)
+
+    def render(self, books: List[Any]) -> str:
+        fragments = [self._open]
+        fragments.extend(self._render_row(self._row_fields(book)) for book in books)
+        fragments.append(TABLE_CLOSE)
+        return "".join(fragments)
+
+    def _render_row(self, fields: RowFields) -> str:
+        with self._lock:
+            cached = self._rows.get(fields)
+            if cached is not None:
+                self._rows.move_to_end(fields)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        title, author, available, total, status, call_numbers = fields
+        row = self._row.format(
+            title=escape(_truncate(title, 35)),
+            author=escape(_truncate(author, 25)),
+            available=available,
+            total=total,
+            status=escape(f"✓ {status}" if available > 0 else f"✗ {status}"),
+            status_color="#28a745" if available > 0 else "#dc3545",
+            status_class="is-available" if available > 0 else "is-unavailable",
+            call_numbers=escape(_format_call_numbers(call_numbers)),
+        )
+
+        with self._lock:
+            self._rows[fields] = row
+            while len(self._rows) > self.cache_size:
+                self._rows.popitem(last=False)
+        return row
+
+    @staticmethod
+    def _row_fields(book: Any) -> RowFields:
+        # Handle both grouped books (dicts) and individual book objects
+        if isinstance(book, dict):
+            return (
+                book["title"],
+                book["author"],
+                book["available_copies"],
+                book["total_copies"],
+                book["status"],
+                tuple(book["call_numbers"]),
+            )
+
+        inventory = getattr(book, "inventory", None)
+        status_raw = getattr(inventory, "status", None) if inventory else None
+        status = status_raw.value if hasattr(status_raw, "value") else status_raw or "Unknown"
+        return (
+            book.title,
+            book.author,
+            getattr(inventory, "copies_available", 0) or 0,
+            getattr(inventory, "total_copies", 0) or 0,
+            status,
+            (book.call_numbers,) if book.call_numbers else (),
+        )
+
+
+def _truncate(text: str, width: int) -> str:
+    return text[:width] + "..." if len(text) > width else text
+
+
+def _format_call_numbers(call_numbers: Tuple[str, ...]) -> str:
+    """Show each copy as its "C<n>" suffix when the call number carries one."""
+    if not call_numbers:
+        return "Not specified"
+    return ", ".join(
+        f"C{call_number.split(' C')[1]}" if " C" in call_number else call_number for call_number in call_numbers
+    )
+
+
+@lru_cache
+def get_books_table_renderer() -> BooksTableRenderer:
+    return BooksTableRenderer.from_settings(get_settings())
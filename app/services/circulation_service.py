@@ -0,0 +1,48 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.repositories.transaction_repository import TransactionRepository
+from app.schemas.transaction import CirculationResponse, TransactionResponse
+
+
+class CirculationError(Exception):
+    """Raised when a borrow or return conflicts with the current inventory."""
+
+
+class CirculationService:
+    """Business logic for borrowing and returning books."""
+
+    def __init__(self, db: Session):
+        self.repository = TransactionRepository(db)
+
+    def borrow(self, book_id: int, user_id: int) -> Optional[CirculationResponse]:
+        if not self._exists(book_id, user_id):
+            return None
+        transaction = self.repository.borrow(book_id, user_id)
+        if transaction is None:
+            raise CirculationError("No copies of this book are available")
+        return self._response(transaction)
+
+    def return_book(self, book_id: int, user_id: int) -> Optional[CirculationResponse]:
+        if not self._exists(book_id, user_id):
+            return None
+        # Both steps share one transaction; a failed copy check also reopens the loan.
+        if not self.repository.close_loan(book_id, user_id):
+            raise CirculationError("This user has no outstanding loan for this book")
+        transaction = self.repository.return_book(book_id, user_id)
+        if transaction is None:
+            raise CirculationError("All copies of this book are already checked in")
+        return self._response(transaction)
+
+    def _exists(self, book_id: int, user_id: int) -> bool:
+        return self.repository.book_exists(book_id) and self.repository.user_exists(user_id)
+
+    def _response(self, transaction) -> CirculationResponse:
+        inventory = self.repository.get_inventory(transaction.book_id)
+        status = inventory.status
+        return CirculationResponse(
+            transaction=TransactionResponse.model_validate(transaction),
+            copies_available=inventory.copies_available,
+            status=getattr(status, "value", status),
+        )
@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable, Iterator, Sequence
+
+from app.schemas.export import ExportFormat
+
+# Rows are flushed to the client in roughly this many characters per chunk.
+CHUNK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def ndjson_lines(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    for row in rows:
+        record = {column: _export_value(value) for column, value in zip(columns, row)}
+        buffer.write(json.dumps(record, ensure_ascii=False))
+        buffer.write("\n")
+        if buffer.tell() >= CHUNK_SIZE:
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+def csv_lines(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_export_value(value) for value in row])
+        if buffer.tell() >= CHUNK_SIZE:
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+def _drain(buffer: io.StringIO) -> str:
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return chunk
+
+
+def encode_rows(
+    export_format: ExportFormat,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> Iterator[str]:
+    if export_format == ExportFormat.CSV:
+        return csv_lines(columns, rows)
+    return ndjson_lines(columns, rows)
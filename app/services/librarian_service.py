@@ -1,18 +1,29 @@
-from typing import Optional, Sequence
+from typing import Any, Dict, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
 from app.models.librarian import Librarian
 from app.repositories.librarian_repository import LibrarianRepository
-from app.schemas.librarian import LibrarianCreate, LibrarianUpdate
+from app.schemas.librarian import LibrarianCreate, LibrarianRead, LibrarianUpdate
+from app.schemas.pagination import Page
 
 
 class LibrarianService:
     def __init__(self, db: Session):
         self.repository = LibrarianRepository(db)
 
-    def list_librarians(self) -> Sequence[Librarian]:
-        return self.repository.list()
+    def list_librarians(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        librarians = self.repository.list(cursor=cursor, limit=limit, fields=fields)
+        if fields is None:
+            return Page[LibrarianRead].from_rows(librarians, limit, LibrarianRead.model_validate)
+        return Page[Dict[str, Any]].from_rows(
+            librarians, limit, lambda librarian: {field: getattr(librarian, field) for field in fields}
+        )
 
     def get_librarian(self, librarian_id: int) -> Optional[Librarian]:
         return self.repository.get(librarian_id)
@@ -1,8 +1,12 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
+from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
+from app.schemas.export import ExportFormat
+from app.schemas.pagination import Batch, Page
+from app.services.export import encode_rows
 from app.schemas.user import UserCreate, UserRead, UserUpdate
 
 
@@ -12,9 +16,23 @@ class UserService:
     def __init__(self, db: Session) -> None:
         self.repository = UserRepository(db)
 
-    def list_users(self) -> List[UserRead]:
-        users = self.repository.list()
-        return [UserRead.model_validate(user) for user in users]
+    def list_users(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        role: Optional[UserRole] = None,
+    ) -> Page:
+        users = self.repository.list(cursor=cursor, limit=limit, fields=fields, role=role)
+        if fields is None:
+            return Page[UserRead].from_rows(users, limit, UserRead.model_validate)
+        return Page[Dict[str, Any]].from_rows(
+            users, limit, lambda user: {field: getattr(user, field) for field in fields}
+        )
+
+    def export_users(self, export_format: ExportFormat) -> Iterator[str]:
+        columns = [column.key for column in User.__table__.columns]
+        return encode_rows(export_format, columns, self.repository.iter_export_rows())
 
     def get_user(self, user_id: int) -> Optional[UserRead]:
         user = self.repository.get(user_id)
@@ -22,6 +40,14 @@ class UserService:
             return None
         return UserRead.model_validate(user)
 
+    def get_users(self, user_ids: List[int]) -> Batch[UserRead]:
+        users = self.repository.get_many(user_ids)
+        found = {user.id for user in users}
+        return Batch[UserRead](
+            items=[UserRead.model_validate(user) for user in users],
+            not_found=[user_id for user_id in user_ids if user_id not in found],
+        )
+
     def create_user(self, data: UserCreate) -> UserRead:
         payload = data.model_dump()
         user = self.repository.create(payload)
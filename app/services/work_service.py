@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import catalog_events
+from app.core.database import SessionLocal
+from app.core.work_rollup import work_rollup
+from app.repositories.book_repository import BookRepository
+from app.schemas.book import WorkPage, WorkRead
+
+
+class WorkService:
+    """Grouped title/author availability served from the in-process rollup."""
+
+    def __init__(self, db: Session):
+        self.repository = BookRepository(db)
+
+    def rebuild(self) -> None:
+        work_rollup.rebuild(self.repository.iter_rollup_rows())
+
+    def list_works(self, limit: int, cursor: Optional[str] = None, title: Optional[str] = None) -> WorkPage:
+        if work_rollup.ready:
+            self.repository.catch_up()
+        else:
+            self.rebuild()
+        groups = work_rollup.page(limit + 1, after=cursor, title=title)
+        items: List[WorkRead] = [WorkRead(**group) for group in groups[:limit]]
+        next_cursor = work_rollup.key(items[-1].title, items[-1].author) if len(groups) > limit else None
+        return WorkPage(items=items, next_cursor=next_cursor)
+
+
+def refresh_works(book_ids: List[int]) -> None:
+    if not work_rollup.ready:
+        return
+    db = SessionLocal()
+    try:
+        work_rollup.refresh(book_ids, BookRepository(db).iter_rollup_rows(book_ids))
+    finally:
+        db.close()
+
+
+catalog_events.subscribe(refresh_works)
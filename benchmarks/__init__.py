@@ -0,0 +1,9 @@
+"""Repeatable latency benchmarks over a synthetic SQLite catalog; run with ``python -m benchmarks``.
+
+Nothing here imports ``app``: its settings are read on first import, so the
+command line has to point DATABASE_URL at the benchmark database first.
+"""
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+CASES = ("list_books", "get_book", "search", "group_books", "assistant_chat")
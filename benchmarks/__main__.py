@@ -0,0 +1,139 @@
+"""Command line entry point: ``python -m benchmarks --size 10k``.
+
+Settings are read when ``app`` is first imported, so the benchmark database is
+configured in the environment before anything from ``app`` is loaded.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from benchmarks import CASES, SIZES
+
+DEFAULT_DATA_DIR = Path(".benchmarks")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--size", choices=sorted(SIZES), default="10k", help="Synthetic catalog size")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per case")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed calls before each case")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cases", default=",".join(CASES), help=f"Comma-separated subset of {', '.join(CASES)}")
+    parser.add_argument("--data-dir", type=Path, default=DEFAULT_DATA_DIR, help="Where generated databases are kept")
+    parser.add_argument("--regenerate", action="store_true", help="Rebuild the database even if it exists")
+    parser.add_argument("--async-db", action="store_true", help="Serve the assistant through aiosqlite")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0, help="Delay added by the OpenRouter stub")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Previous JSON report to diff against")
+    args = parser.parse_args(argv)
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = sorted(set(cases) - set(CASES))
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    args.data_dir.mkdir(parents=True, exist_ok=True)
+    database = (args.data_dir / f"catalog-{args.size}-seed{args.seed}.sqlite").resolve()
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    os.environ["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{database}" if args.async_db else ""
+    os.environ.setdefault("OPENROUTER_MODEL", "benchmark-stub")
+    # Decided before importing app, whose startup may create an empty database file.
+    generated = args.regenerate or not database.exists()
+
+    from app.core.config import get_settings
+    from app.core.database import engine
+    from benchmarks.catalog import CatalogGenerator, speed_up_bulk_load
+    from benchmarks.suite import BenchmarkSuite
+    from benchmarks.timing import compare
+
+    generate_seconds = None
+    if generated:
+        speed_up_bulk_load(engine)
+        started = time.perf_counter()
+        summary = CatalogGenerator(SIZES[args.size], args.seed).write(engine)
+        generate_seconds = time.perf_counter() - started
+        print(f"Generated {summary.books} books ({summary.titles} titles) in {generate_seconds:.1f}s", file=sys.stderr)
+
+    suite = BenchmarkSuite(
+        SIZES[args.size],
+        iterations=args.iterations,
+        seed=args.seed,
+        warmup=args.warmup,
+        stub_latency_ms=args.stub_latency_ms,
+    )
+    results = suite.run(cases)
+    settings = get_settings()
+
+    report = {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": args.size,
+        "books": SIZES[args.size],
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "async_db": args.async_db,
+        "stub_latency_ms": args.stub_latency_ms,
+        "settings": {
+            "book_cache_enabled": settings.book_cache_enabled,
+            "search_backend": settings.search_backend,
+            "answer_cache_size": settings.answer_cache_size,
+            "summary_fetch_concurrency": settings.summary_fetch_concurrency,
+        },
+        "setup": {"generate_seconds": generate_seconds, **suite.setup},
+        "results": results,
+    }
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        report["compared_to"] = baseline.get("commit")
+        report["change_percent"] = compare(results, baseline.get("results", {}))
+
+    _print_table(results, report.get("change_percent"))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+def _git_commit() -> Dict[str, object]:
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {"sha": None, "dirty": None}
+    return {"sha": sha, "dirty": bool(status.strip())}
+
+
+def _print_table(results: Dict[str, Dict], changes: Optional[Dict[str, Dict]]) -> None:
+    header = f"{'case':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}"
+    if changes:
+        header += f"{'Δp50 %':>10}"
+    print(header, file=sys.stderr)
+    for name, result in results.items():
+        line = (
+            f"{name:<16}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['throughput_per_s']:>10.1f}"
+        )
+        change = (changes or {}).get(name, {}).get("p50_ms")
+        if change is not None:
+            line += f"{change:>+10.1f}"
+        print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
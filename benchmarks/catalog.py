@@ -0,0 +1,218 @@
+"""Deterministic synthetic catalog written straight into a SQLite benchmark database."""
+
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List
+
+from sqlalchemy import Engine, event, insert
+
+from app.core.database import Base
+from app.models import book, book_fulltext, book_trigram, catalog_version, transaction, user  # noqa: F401
+from app.models.book import Book, BookStatus
+from app.models.book_acquisition import BookAcquisition
+from app.models.book_inventory import BookInventory
+from app.models.transaction import Transaction
+from app.models.user import User, UserRole
+
+BATCH_SIZE = 10_000
+
+ADJECTIVES = (
+    "Advanced", "Applied", "Modern", "Practical", "Essential", "Elementary", "Comprehensive",
+    "Introductory", "Philippine", "Contemporary", "Fundamental", "Classical", "Digital", "Global",
+    "Strategic", "Quantitative", "Environmental", "Clinical", "Comparative", "Hidden",
+)
+SUBJECTS = (
+    "Calculus", "Algebra", "Statistics", "Physics", "Chemistry", "Biology", "Accounting",
+    "Economics", "Marketing", "Management", "Philosophy", "Literature", "History", "Sociology",
+    "Psychology", "Education", "Engineering", "Architecture", "Nursing", "Programming",
+    "Databases", "Networks", "Thermodynamics", "Hydraulics", "Surveying", "Electronics",
+    "Criminology", "Tourism", "Agriculture", "Fisheries", "Linguistics", "Rhetoric",
+)
+NOUNS = (
+    "Principles", "Methods", "Foundations", "Concepts", "Perspectives", "Systems", "Theory",
+    "Practice", "Analysis", "Design", "Handbook", "Essays", "Readings", "Cases", "Applications",
+    "Stories", "Voices", "Frontiers", "Patterns", "Structures",
+)
+FIRST_NAMES = (
+    "Maria", "Jose", "Juan", "Ana", "Antonio", "Rosa", "Pedro", "Carmen", "Ramon", "Elena",
+    "John", "Mary", "James", "Patricia", "Robert", "Linda", "Michael", "Susan", "David", "Karen",
+    "Li", "Wei", "Hiroshi", "Yuki", "Ahmed", "Fatima", "Carlos", "Lucia", "Andre", "Nadia",
+)
+LAST_NAMES = (
+    "Santos", "Reyes", "Cruz", "Bautista", "Garcia", "Mendoza", "Torres", "Flores", "Ramos",
+    "Villanueva", "Smith", "Johnson", "Brown", "Taylor", "Anderson", "Thompson", "Nakamura",
+    "Tanaka", "Chen", "Wang", "Hassan", "Rahman", "Silva", "Costa", "Dubois", "Moreau",
+    "Schmidt", "Fischer", "Kowalski", "Novak",
+)
+PUBLISHERS = (
+    "Rex Book Store", "National Book Store", "Pearson", "McGraw-Hill", "Wiley", "Cengage",
+    "Oxford University Press", "Cambridge University Press", "Springer", "Anvil Publishing",
+)
+BOOK_TYPES = ("Book", "Reference", "Thesis", "Filipiniana", "Periodical")
+LOCATIONS = ("Circulation", "Reference Section", "Filipiniana Section", "Graduate Library", "Reserve")
+FUNDS = ("School fund", "Donation", "Government grant", "Alumni gift")
+CALL_CLASSES = ("QA", "QC", "QD", "QH", "HF", "HB", "HD", "B", "PN", "PR", "DS", "HM", "BF", "LB", "TA", "NA", "RT")
+
+
+@dataclass(frozen=True)
+class CatalogSummary:
+    books: int
+    titles: int
+    users: int
+    transactions: int
+
+
+class CatalogGenerator:
+    """Books come in title/author groups of one to four copies, like the real shelf list."""
+
+    def __init__(self, book_count: int, seed: int = 42) -> None:
+        self.book_count = book_count
+        self.seed = seed
+        self.user_count = max(100, book_count // 20)
+        self.transaction_count = book_count // 5
+
+    def write(self, engine: Engine) -> CatalogSummary:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        rng = random.Random(self.seed)
+        titles = 0
+
+        with engine.begin() as connection:
+            for batch in _batched(self._books(rng), BATCH_SIZE):
+                connection.execute(insert(Book), [row["book"] for row in batch])
+                connection.execute(insert(BookInventory), [row["inventory"] for row in batch])
+                connection.execute(insert(BookAcquisition), [row["acquisition"] for row in batch])
+                titles += sum(1 for row in batch if row["first_copy"])
+            for batch in _batched(self._users(rng), BATCH_SIZE):
+                connection.execute(insert(User), batch)
+            for batch in _batched(self._transactions(rng), BATCH_SIZE):
+                connection.execute(insert(Transaction), batch)
+
+        return CatalogSummary(
+            books=self.book_count,
+            titles=titles,
+            users=self.user_count,
+            transactions=self.transaction_count,
+        )
+
+    def _books(self, rng: random.Random) -> Iterator[Dict]:
+        book_id = 0
+        work = 0
+        while book_id < self.book_count:
+            work += 1
+            title = self._title(rng)
+            author = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            year = rng.randint(1965, 2024)
+            call_number = (
+                f"{rng.choice(CALL_CLASSES)}{rng.randint(1, 999)}.{rng.randint(10, 99)} "
+                f".{author.split()[-1][0]}{rng.randint(10, 99)} {year}"
+            )
+            category = rng.choice(SUBJECTS)
+            book_type = rng.choice(BOOK_TYPES)
+            location = rng.choice(LOCATIONS)
+            copies = min(rng.choice((1, 1, 1, 2, 2, 3, 4)), self.book_count - book_id)
+
+            for copy in range(1, copies + 1):
+                book_id += 1
+                total = rng.randint(1, 3)
+                available = rng.randint(0, total)
+                yield {
+                    "first_copy": copy == 1,
+                    "book": {
+                        "id": book_id,
+                        "title": title,
+                        "author": author,
+                        # isbn is unique, so only the first copy of a work carries it.
+                        "isbn": f"978{work:010d}" if copy == 1 else None,
+                        "category": category,
+                        "pages": rng.randint(80, 1200),
+                        "call_numbers": f"{call_number} C{copy}",
+                        "book_type": book_type,
+                        "book_location": location,
+                    },
+                    "inventory": {
+                        "book_id": book_id,
+                        "total_copies": total,
+                        "copies_available": available,
+                        "status": (BookStatus.AVAILABLE if available else BookStatus.BORROWED).value,
+                        "added_at": datetime(year, 1, 1) + timedelta(days=rng.randint(0, 364)),
+                    },
+                    "acquisition": {
+                        "book_id": book_id,
+                        "date_received": date(year, 1, 1) + timedelta(days=rng.randint(0, 364)),
+                        "source_of_fund": rng.choice(FUNDS),
+                        "place": "Tacloban City",
+                        "publisher": rng.choice(PUBLISHERS),
+                        "published_year": year,
+                        "date_copyright": date(year, 1, 1),
+                        "volume_edition": f"{rng.randint(1, 12)}th ed.",
+                    },
+                }
+
+    def _users(self, rng: random.Random) -> Iterator[Dict]:
+        roles = list(UserRole)
+        for user_id in range(1, self.user_count + 1):
+            role = rng.choice(roles)
+            yield {
+                "id": user_id,
+                "first_name": rng.choice(FIRST_NAMES),
+                "middle_name": None,
+                "last_name": rng.choice(LAST_NAMES),
+                "email": f"user{user_id}@example.edu",
+                "student_id": f"2024-{user_id:06d}" if role is UserRole.STUDENT else None,
+                "age": rng.randint(17, 65),
+                "role": role.value,
+                "course_year": None,
+                "is_male": rng.random() < 0.5,
+                "school_id_image": None,
+                "contact": None,
+            }
+
+    def _transactions(self, rng: random.Random) -> Iterator[Dict]:
+        start = datetime(2024, 1, 1)
+        for transaction_id in range(1, self.transaction_count + 1):
+            yield {
+                "id": transaction_id,
+                "book_id": rng.randint(1, self.book_count),
+                "user_id": rng.randint(1, self.user_count),
+                "type": "borrow" if transaction_id % 2 else "return",
+                "status": "done",
+                "timestamp": start + timedelta(minutes=transaction_id),
+            }
+
+    @staticmethod
+    def _title(rng: random.Random) -> str:
+        subject = rng.choice(SUBJECTS)
+        template = rng.randrange(5)
+        if template == 0:
+            return f"{rng.choice(ADJECTIVES)} {subject}"
+        if template == 1:
+            return f"{rng.choice(NOUNS)} of {rng.choice(ADJECTIVES)} {subject}"
+        if template == 2:
+            return f"Introduction to {subject}"
+        if template == 3:
+            return f"{subject}: {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}"
+        return f"The {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} in {subject}"
+
+
+def speed_up_bulk_load(engine: Engine) -> None:
+    """Trade durability for load speed; the benchmark database is disposable."""
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+
+def _batched(rows: Iterator[Dict], size: int) -> Iterator[List[Dict]]:
+    batch: List[Dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,33 @@
+"""In-process stand-ins for OpenRouter and OpenLibrary so the assistant path never leaves the machine."""
+
+import asyncio
+import json
+
+import httpx
+
+
+class ExternalApiStub:
+    """``httpx`` transport answering completions and summary lookups after a fixed delay."""
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency = latency_ms / 1000
+        self.requests = 0
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if request.url.host == "openrouter.ai":
+            body = json.loads(request.content)
+            question = body["messages"][-1]["content"][:80]
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"content": f"Here is what the catalog has for: {question}"}}]},
+            )
+        if request.url.path == "/search.json":
+            return httpx.Response(200, json={"docs": [{"key": "/works/OL1W"}]})
+        return httpx.Response(200, json={"description": "A synthetic summary used for benchmarking."})
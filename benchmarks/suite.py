@@ -0,0 +1,130 @@
+"""The timed cases; every case draws its inputs from a seeded RNG so runs are repeatable."""
+
+import random
+import time
+from typing import Callable, Dict, List, Sequence
+
+from fastapi.testclient import TestClient
+
+from app.core.answer_cache import get_answer_cache
+from app.core.database import SessionLocal
+from app.main import app
+from app.repositories.book_repository import BookRepository
+from app.services.ai_assistant_service import AIAssistantService
+from app.services.book_service import BookService
+from benchmarks import CASES
+from benchmarks.catalog import ADJECTIVES, LAST_NAMES, NOUNS, SUBJECTS
+from benchmarks.stub import ExternalApiStub
+from benchmarks.timing import measure
+
+PAGE_SIZE = 100
+
+
+class BenchmarkSuite:
+    def __init__(
+        self,
+        book_count: int,
+        iterations: int,
+        seed: int = 42,
+        warmup: int = 10,
+        stub_latency_ms: float = 0.0,
+    ) -> None:
+        self.book_count = book_count
+        self.iterations = iterations
+        self.seed = seed
+        self.warmup = warmup
+        self.stub = ExternalApiStub(stub_latency_ms)
+        self.setup: Dict[str, float] = {}
+
+    def run(self, cases: Sequence[str]) -> Dict[str, Dict]:
+        started = time.perf_counter()
+        # Entering the client runs the lifespan, which builds the search index and work rollup.
+        with TestClient(app) as client:
+            self.setup["startup_seconds"] = time.perf_counter() - started
+            # Swap the stub in for the run only, so the lifespan still closes its own client.
+            lifespan_client = app.state.http_client
+            app.state.http_client = stub_client = self.stub.client()
+            try:
+                results = {}
+                for case in cases:
+                    results[case] = getattr(self, f"_{case}")(client)
+            finally:
+                app.state.http_client = lifespan_client
+                client.portal.call(stub_client.aclose)
+        if "assistant_chat" in results:
+            results["assistant_chat"]["answer_cache"] = get_answer_cache().stats()
+        return results
+
+    def _list_books(self, client: TestClient) -> Dict:
+        cursors = self._sample("list_books", lambda rng: rng.randint(0, max(self.book_count - PAGE_SIZE, 0)))
+
+        def list_page(cursor: int) -> None:
+            with SessionLocal() as db:
+                BookService(db).list_books(limit=PAGE_SIZE, cursor=cursor)
+
+        return measure(list_page, cursors, self.warmup)
+
+    def _get_book(self, client: TestClient) -> Dict:
+        book_ids = self._sample("get_book", lambda rng: rng.randint(1, self.book_count))
+
+        def get_book(book_id: int) -> None:
+            with SessionLocal() as db:
+                BookService(db).get_book(book_id)
+
+        return measure(get_book, book_ids, self.warmup)
+
+    def _search(self, client: TestClient) -> Dict:
+        def search(query: str) -> None:
+            with SessionLocal() as db:
+                BookRepository(db).search(query)
+
+        return measure(search, self._sample("search", _search_query), self.warmup)
+
+    def _group_books(self, client: TestClient) -> Dict:
+        # Only the in-memory grouping is timed; the matches are loaded up front.
+        with SessionLocal() as db:
+            repository = BookRepository(db)
+            matches = [repository.search(query) for query in self._sample("group_books", _search_query)]
+            service = AIAssistantService(db, app.state.http_client)
+            return measure(service._group_books_by_title_author, matches, self.warmup)
+
+    def _assistant_chat(self, client: TestClient) -> Dict:
+        answers = get_answer_cache()
+
+        def chat(query: str) -> None:
+            # Sampled queries repeat; without this the case mostly times answer-cache hits.
+            answers.clear()
+            response = client.post("/assistant/chat", json={"query": query})
+            response.raise_for_status()
+
+        return measure(chat, self._sample("assistant_chat", _chat_query), self.warmup)
+
+    def _sample(self, case: str, draw: Callable[[random.Random], object]) -> List:
+        # Each case gets its own stream so adding or skipping cases leaves the others unchanged.
+        rng = random.Random(f"{self.seed}:{case}")
+        return [draw(rng) for _ in range(self.iterations + self.warmup)]
+
+
+def _search_query(rng: random.Random) -> str:
+    kind = rng.randrange(4)
+    if kind == 0:
+        return rng.choice(SUBJECTS)
+    if kind == 1:
+        return f"{rng.choice(ADJECTIVES)} {rng.choice(SUBJECTS)}"
+    if kind == 2:
+        return rng.choice(LAST_NAMES)
+    # A dropped letter sends the query down the fuzzy trigram path.
+    word = rng.choice(SUBJECTS)
+    position = rng.randrange(1, len(word) - 1)
+    return word[:position] + word[position + 1 :]
+
+
+def _chat_query(rng: random.Random) -> str:
+    kind = rng.randrange(10)
+    if kind == 0:
+        return f"Can you give me a summary of Introduction to {rng.choice(SUBJECTS)}?"
+    if kind < 4:
+        return f"Do you have books by {rng.choice(LAST_NAMES)}?"
+    if kind < 7:
+        return f"Is {rng.choice(NOUNS)} of {rng.choice(ADJECTIVES)} {rng.choice(SUBJECTS)} available?"
+    return f"What books do you have on {rng.choice(SUBJECTS)}?"
@@ -0,0 +1,55 @@
+"""Latency sampling and the percentile summary stored in benchmark reports."""
+
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+REPORTED_METRICS = ("p50_ms", "p95_ms", "p99_ms", "mean_ms", "throughput_per_s")
+
+
+def measure(operation: Callable[[Any], Any], arguments: Iterable[Any], warmup: int = 10) -> Dict[str, float]:
+    """Call ``operation`` once per argument and summarize the per-call latency.
+
+    The first ``warmup`` calls prime caches and connections and are not recorded.
+    """
+    arguments = list(arguments)
+    for argument in arguments[:warmup]:
+        operation(argument)
+
+    samples = []
+    started = time.perf_counter()
+    for argument in arguments[warmup:]:
+        call_started = time.perf_counter()
+        operation(argument)
+        samples.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    return summarize(samples, elapsed)
+
+
+def summarize(samples: list, elapsed: float) -> Dict[str, float]:
+    if len(samples) < 2:
+        raise ValueError("Need at least two timed calls; raise --iterations")
+    cut_points = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "count": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": cut_points[49] * 1000,
+        "p95_ms": cut_points[94] * 1000,
+        "p99_ms": cut_points[98] * 1000,
+        "max_ms": max(samples) * 1000,
+        "throughput_per_s": len(samples) / elapsed if elapsed else 0.0,
+    }
+
+
+def compare(current: Dict[str, Dict], baseline: Dict[str, Dict]) -> Dict[str, Dict[str, Optional[float]]]:
+    """Percent change per metric against a previous report (negative latency change is an improvement)."""
+    changes: Dict[str, Dict[str, Optional[float]]] = {}
+    for name, result in current.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        changes[name] = {
+            metric: (result[metric] - previous[metric]) / previous[metric] * 100 if previous.get(metric) else None
+            for metric in REPORTED_METRICS
+        }
+    return changes
@@ -0,0 +1,75 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.core.database import Base, engine
+# Import every model module so autogenerate sees the full metadata.
+from app.models import (  # noqa: F401
+    book,
+    book_acquisition,
+    book_fulltext,
+    book_inventory,
+    book_trigram,
+    catalog_version,
+    librarian,
+    transaction,
+    user,
+)
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_name(name, type_, parent_names) -> bool:
+    # The SQLite FTS5 table and its shadow tables are managed by hand in 0003.
+    return not (type_ == "table" and name.startswith("books_fts"))
+
+
+def include_object(object_, name, type_, reflected, compare_to) -> bool:
+    dialect = getattr(object_, "info", {}).get("dialect")
+    return dialect is None or dialect == context.get_bind().dialect.name
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # Callers such as the tests may hand in a connection to a database of their own.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations(connection)
+        return
+    with engine.connect() as connection:
+        run_migrations(connection)
+
+
+def run_migrations(connection) -> None:
+    # batch mode lets ALTER-style migrations run on SQLite as well as MySQL.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+        include_name=include_name,
+        include_object=include_object,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,131 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 22:24:59.864137
+
+Matches what ``Base.metadata.create_all`` produced before migrations existed.
+Databases created that way are brought up to date with ``alembic stamp 0001``
+followed by ``alembic upgrade head``.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "books",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("author", sa.String(length=255), nullable=False),
+        sa.Column("isbn", sa.String(length=64), nullable=True),
+        sa.Column("category", sa.String(length=100), nullable=True),
+        sa.Column("pages", sa.Integer(), nullable=True),
+        sa.Column("call_numbers", sa.String(length=255), nullable=True),
+        sa.Column("book_type", sa.String(length=100), nullable=True),
+        sa.Column("book_location", sa.String(length=100), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("isbn"),
+    )
+    op.create_index("ix_books_id", "books", ["id"])
+
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("first_name", sa.String(length=255), nullable=False),
+        sa.Column("middle_name", sa.String(length=255), nullable=True),
+        sa.Column("last_name", sa.String(length=255), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("student_id", sa.String(length=50), nullable=True),
+        sa.Column("age", sa.Integer(), nullable=True),
+        sa.Column(
+            "role",
+            sa.Enum("student", "faculty", "non-faculty", name="userrole", native_enum=False),
+            nullable=False,
+        ),
+        sa.Column("course_year", sa.String(length=100), nullable=True),
+        sa.Column("is_male", sa.Boolean(), nullable=True),
+        sa.Column("school_id_image", sa.String(length=255), nullable=True),
+        sa.Column("contact", sa.String(length=50), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("student_id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"])
+
+    op.create_table(
+        "librarians",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("contact", sa.String(length=50), nullable=True),
+        sa.Column("librarian_id_image", sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_librarians_email", "librarians", ["email"], unique=True)
+    op.create_index("ix_librarians_id", "librarians", ["id"])
+
+    op.create_table(
+        "book_acquisitions",
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("date_received", sa.Date(), nullable=True),
+        sa.Column("source_of_fund", sa.String(length=255), nullable=True),
+        sa.Column("place", sa.String(length=255), nullable=True),
+        sa.Column("publisher", sa.String(length=255), nullable=True),
+        sa.Column("published_year", sa.Integer(), nullable=True),
+        sa.Column("date_copyright", sa.Date(), nullable=True),
+        sa.Column("volume_edition", sa.String(length=255), nullable=True),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"]),
+        sa.PrimaryKeyConstraint("book_id"),
+    )
+
+    op.create_table(
+        "book_inventory",
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("total_copies", sa.Integer(), nullable=False),
+        sa.Column("copies_available", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("available", "borrowed", name="book_status", native_enum=False),
+            nullable=False,
+        ),
+        sa.Column("added_at", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"]),
+        sa.PrimaryKeyConstraint("book_id"),
+    )
+
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("type", sa.Enum("borrow", "return", name="transaction_type"), nullable=False),
+        sa.Column("status", sa.Enum("pending", "done", name="transaction_status"), nullable=True),
+        sa.Column("timestamp", sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_transactions_id", "transactions", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_id", table_name="transactions")
+    op.drop_table("transactions")
+    op.drop_table("book_inventory")
+    op.drop_table("book_acquisitions")
+    op.drop_index("ix_librarians_id", table_name="librarians")
+    op.drop_index("ix_librarians_email", table_name="librarians")
+    op.drop_table("librarians")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+    op.drop_index("ix_books_id", table_name="books")
+    op.drop_table("books")
@@ -0,0 +1,45 @@
+"""catalog support tables
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:02:11.406518
+
+``book_trigrams`` backs the fuzzy search fallback on MySQL and is filled by the
+app on first start. ``catalog_versions`` starts empty: a book without a row is
+at version 0.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "book_trigrams",
+        sa.Column("trigram", sa.String(length=3), nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("field", sa.String(length=16), nullable=False),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("trigram", "book_id", "field"),
+    )
+    op.create_index("ix_book_trigrams_book_id", "book_trigrams", ["book_id"])
+
+    op.create_table(
+        "catalog_versions",
+        sa.Column("book_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint("book_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_versions")
+    op.drop_index("ix_book_trigrams_book_id", table_name="book_trigrams")
+    op.drop_table("book_trigrams")
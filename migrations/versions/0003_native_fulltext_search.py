@@ -0,0 +1,60 @@
+"""native full-text search
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 23:41:08.512903
+
+FULLTEXT indexes on MySQL, an FTS5 table plus sync triggers on SQLite; other
+dialects are left untouched and keep using the in-process index.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ["title", "author", "category", "book_type", "book_location", "call_numbers"]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        op.create_index("ix_books_fulltext", "books", COLUMNS, mysql_prefix="FULLTEXT")
+        op.create_index("ix_books_title_fulltext", "books", ["title"], mysql_prefix="FULLTEXT")
+    elif dialect == "sqlite":
+        columns = ", ".join(COLUMNS)
+        new_values = ", ".join(f"new.{name}" for name in COLUMNS)
+        old_values = ", ".join(f"old.{name}" for name in COLUMNS)
+        op.execute(
+            f"CREATE VIRTUAL TABLE books_fts USING fts5({columns}, content='books', content_rowid='id', "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER books_fts_insert AFTER INSERT ON books BEGIN "
+            f"INSERT INTO books_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        )
+        op.execute(
+            "CREATE TRIGGER books_fts_delete AFTER DELETE ON books BEGIN "
+            f"INSERT INTO books_fts(books_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER books_fts_update AFTER UPDATE OF {columns} ON books BEGIN "
+            f"INSERT INTO books_fts(books_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO books_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        )
+        # Index the rows that already exist.
+        op.execute("INSERT INTO books_fts(books_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        op.drop_index("ix_books_title_fulltext", table_name="books")
+        op.drop_index("ix_books_fulltext", table_name="books")
+    elif dialect == "sqlite":
+        for trigger in ("books_fts_update", "books_fts_delete", "books_fts_insert"):
+            op.execute(f"DROP TRIGGER {trigger}")
+        op.execute("DROP TABLE books_fts")
@@ -0,0 +1,70 @@
+"""transaction returned_at
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:12:37.208114
+
+Open loans become rows instead of a borrow/return balance, so a return can
+claim one with a conditional UPDATE. Existing returns close the oldest open
+borrows of the same user and book.
+"""
+from collections import defaultdict, deque
+from typing import Deque, Dict, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.add_column(sa.Column("returned_at", sa.TIMESTAMP(), nullable=True))
+        batch_op.create_index("ix_transactions_loan", ["book_id", "user_id"])
+
+    transactions = sa.table(
+        "transactions",
+        sa.column("id", sa.Integer),
+        sa.column("book_id", sa.Integer),
+        sa.column("user_id", sa.Integer),
+        sa.column("type", sa.String),
+        sa.column("status", sa.String),
+        sa.column("timestamp", sa.TIMESTAMP),
+        sa.column("returned_at", sa.TIMESTAMP),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(
+            transactions.c.id,
+            transactions.c.book_id,
+            transactions.c.user_id,
+            transactions.c.type,
+            transactions.c.timestamp,
+        )
+        .where(transactions.c.status == "done")
+        .order_by(transactions.c.id)
+    )
+    open_loans: Dict[Tuple[int, int], Deque[int]] = defaultdict(deque)
+    closed = []
+    for row in rows:
+        loans = open_loans[(row.book_id, row.user_id)]
+        if row.type == "borrow":
+            loans.append(row.id)
+        elif loans:
+            closed.append({"loan_id": loans.popleft(), "returned_at": row.timestamp})
+    if closed:
+        bind.execute(
+            transactions.update()
+            .where(transactions.c.id == sa.bindparam("loan_id"))
+            .values(returned_at=sa.bindparam("returned_at")),
+            closed,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch_op:
+        batch_op.drop_index("ix_transactions_loan")
+        batch_op.drop_column("returned_at")
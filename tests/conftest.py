@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+# Settings and the engine are read when ``app`` is first imported, so the test
+# database is configured before any test module loads it.
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.db"
+os.environ.setdefault("OPENROUTER_MODEL", "test")
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_book(client):
+    """Create a book through the API and return its JSON; keyword arguments override the payload."""
+
+    def make(title: str, author: str = "Tester", copies: int = 2, **fields):
+        payload = {
+            "title": title,
+            "author": author,
+            "inventory": {"total_copies": copies, "copies_available": copies},
+            **fields,
+        }
+        response = client.post("/books/", json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    return make
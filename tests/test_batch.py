@@ -0,0 +1,51 @@
+from sqlalchemy import update
+
+from app.models.book import Book
+from app.repositories.catalog_version_repository import CatalogVersionRepository
+from app.schemas.pagination import MAX_BATCH_IDS
+
+
+def batch(client, ids, **params):
+    response = client.get("/books/", params={"ids": ids, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_books_come_back_in_request_order_with_missing_ids(client, make_book):
+    first, second = (make_book(f"Batch Book {index}")["id"] for index in range(2))
+    missing = 10**9
+
+    result = batch(client, f"{second},{missing},{first},{second}")
+    assert [book["id"] for book in result["items"]] == [second, first]
+    assert result["not_found"] == [missing]
+
+    sparse = batch(client, f"{first}", fields="title")
+    assert sparse["items"] == [{"id": first, "title": "Batch Book 0"}]
+
+
+def test_malformed_or_oversized_id_lists_are_rejected(client):
+    for ids in (",,", "", "1,x", ",".join(map(str, range(1, MAX_BATCH_IDS + 2)))):
+        assert client.get("/books/", params={"ids": ids}).status_code == 400, ids
+
+
+def test_batch_reads_see_changes_from_another_worker(client, db, make_book):
+    book_id = make_book("Batch Behind Its Back")["id"]
+    assert batch(client, str(book_id))["items"][0]["title"] == "Batch Behind Its Back"
+
+    db.execute(update(Book).where(Book.id == book_id).values(title="Batch Renamed Elsewhere"))
+    CatalogVersionRepository(db).bump([book_id])
+    db.commit()
+
+    assert batch(client, str(book_id))["items"][0]["title"] == "Batch Renamed Elsewhere"
+
+
+def test_user_batch_reports_unknown_ids(client):
+    response = client.post("/users/", json={"first_name": "Batch", "last_name": "User", "role": "student"})
+    user_id = response.json()["id"]
+
+    response = client.post("/users/batch", json={"ids": [10**9, user_id, user_id]})
+    assert response.status_code == 200, response.text
+    assert [user["id"] for user in response.json()["items"]] == [user_id]
+    assert response.json()["not_found"] == [10**9]
+
+    assert client.post("/users/batch", json={"ids": []}).status_code == 422
@@ -0,0 +1,40 @@
+from sqlalchemy import update
+
+from app.models.book import Book
+from app.repositories.catalog_version_repository import CatalogVersionRepository
+
+
+def cache_stats(client):
+    response = client.get("/admin/book-cache")
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_repeat_reads_are_served_from_the_cache(client, make_book):
+    book_id = make_book("Cached Book")["id"]
+    assert client.get(f"/books/{book_id}").status_code == 200
+    before = cache_stats(client)
+
+    assert client.get(f"/books/{book_id}").json()["title"] == "Cached Book"
+    after = cache_stats(client)
+    assert after["hits"] == before["hits"] + 1 and after["misses"] == before["misses"]
+
+
+def test_local_writes_invalidate_the_cached_book(client, make_book):
+    book_id = make_book("Cached Then Edited")["id"]
+    assert client.get(f"/books/{book_id}").status_code == 200
+
+    assert client.put(f"/books/{book_id}", json={"author": "Someone Else"}).status_code == 200
+    assert client.get(f"/books/{book_id}").json()["author"] == "Someone Else"
+
+
+def test_changes_from_another_worker_are_not_served_stale(client, db, make_book):
+    book_id = make_book("Cached Behind Its Back")["id"]
+    assert client.get(f"/books/{book_id}").status_code == 200
+
+    # Another worker's commit: the row and its version move, but this process sees no ORM event.
+    db.execute(update(Book).where(Book.id == book_id).values(title="Renamed Elsewhere"))
+    CatalogVersionRepository(db).bump([book_id])
+    db.commit()
+
+    assert client.get(f"/books/{book_id}").json()["title"] == "Renamed Elsewhere"
@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from sqlalchemy import func, select
+
+from app.models.book_inventory import BookInventory
+from app.models.transaction import Transaction
+
+
+def make_user(client, name):
+    response = client.post("/users/", json={"first_name": name, "last_name": "Circulation", "role": "student"})
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def race(client, path, payloads):
+    """POST every payload at once and return the status codes in payload order."""
+    barrier = Barrier(len(payloads))
+
+    def post(payload):
+        barrier.wait()
+        return client.post(path, json=payload).status_code
+
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        return list(pool.map(post, payloads))
+
+
+def test_concurrent_checkouts_never_oversell(client, db, make_book):
+    book_id = make_book("Contended Checkout", copies=3)["id"]
+    user_ids = [make_user(client, f"Borrower{index}") for index in range(8)]
+
+    codes = race(client, "/circulation/borrow", [{"book_id": book_id, "user_id": user_id} for user_id in user_ids])
+
+    assert sorted(codes) == [201] * 3 + [409] * 5
+    inventory = db.get(BookInventory, book_id)
+    assert (inventory.copies_available, getattr(inventory.status, "value", inventory.status)) == (0, "borrowed")
+    borrows = db.scalar(select(func.count()).where(Transaction.book_id == book_id, Transaction.type == "borrow"))
+    assert borrows == 3
+
+
+def test_racing_returns_of_one_loan_close_it_once(client, db, make_book):
+    book_id = make_book("Contended Return", copies=2)["id"]
+    user_id = make_user(client, "Returner")
+    payload = {"book_id": book_id, "user_id": user_id}
+    assert client.post("/circulation/borrow", json=payload).status_code == 201
+
+    codes = race(client, "/circulation/return", [payload] * 4)
+
+    assert sorted(codes) == [201] + [409] * 3
+    assert db.get(BookInventory, book_id).copies_available == 2
+    returns = db.scalar(select(func.count()).where(Transaction.book_id == book_id, Transaction.type == "return"))
+    assert returns == 1
+
+
+def test_return_without_a_loan_is_a_conflict(client, make_book):
+    book_id = make_book("Never Borrowed", copies=1)["id"]
+    user_id = make_user(client, "NoLoan")
+
+    response = client.post("/circulation/return", json={"book_id": book_id, "user_id": user_id})
+    assert response.status_code == 409
+    assert client.post("/circulation/borrow", json={"book_id": book_id, "user_id": 10**9}).status_code == 404
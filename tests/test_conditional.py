@@ -0,0 +1,69 @@
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.core.database import engine
+
+
+@contextmanager
+def statements():
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_matching_etag_skips_the_book_query(client, make_book):
+    book_id = make_book("Conditional Book")["id"]
+    first = client.get(f"/books/{book_id}")
+    etag = first.headers["ETag"]
+
+    with statements() as executed:
+        cached = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b""
+    assert cached.headers["ETag"] == etag
+    assert not any("FROM books" in statement or "book_inventory" in statement for statement in executed)
+
+    # Both catalog edits and checkouts change the representation, so both move the tag.
+    assert client.put(f"/books/{book_id}", json={"title": "Conditional Book 2"}).status_code == 200
+    edited = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+    assert edited.status_code == 200 and edited.json()["title"] == "Conditional Book 2"
+
+    user = client.post("/users/", json={"first_name": "Etag", "last_name": "Reader", "role": "student"}).json()
+    borrow = {"book_id": book_id, "user_id": user["id"]}
+    assert client.post("/circulation/borrow", json=borrow).status_code == 201
+    borrowed = client.get(f"/books/{book_id}", headers={"If-None-Match": edited.headers["ETag"]})
+    assert borrowed.status_code == 200
+    assert borrowed.json()["inventory"]["copies_available"] == 1
+
+
+def test_listing_etags_follow_the_query_and_the_catalog(client, make_book):
+    make_book("Conditional Listing", category="Conditional Shelf")
+    params = {"category": "Conditional Shelf"}
+    etag = client.get("/books/", params=params).headers["ETag"]
+
+    assert client.get("/books/", params=params, headers={"If-None-Match": etag}).status_code == 304
+    other = client.get("/books/", params={**params, "limit": 5}, headers={"If-None-Match": etag})
+    assert other.status_code == 200 and other.headers["ETag"] != etag
+
+    make_book("Conditional Listing 2", category="Conditional Shelf")
+    changed = client.get("/books/", params=params, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and len(changed.json()["items"]) == 2
+
+
+def test_last_modified_is_sent_once_its_second_has_passed(client, make_book):
+    book_id = make_book("Conditional Dates")["id"]
+    assert "Last-Modified" not in client.get(f"/books/{book_id}").headers
+
+    time.sleep(1.1)
+    response = client.get(f"/books/{book_id}")
+    last_modified = response.headers["Last-Modified"]
+    cached = client.get(f"/books/{book_id}", headers={"If-Modified-Since": last_modified})
+    assert cached.status_code == 304
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from app.core.config import get_settings
+from app.core.database import Base
+from app.models.book_fulltext import FTS_TABLE
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fulltext.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def search_backend(monkeypatch):
+    def use(backend):
+        monkeypatch.setenv("SEARCH_BACKEND", backend)
+        get_settings.cache_clear()
+
+    yield use
+    monkeypatch.undo()
+    get_settings.cache_clear()
+
+
+def test_create_all_skips_fts_for_the_memory_backend(engine, search_backend):
+    search_backend("memory")
+    Base.metadata.create_all(bind=engine)
+
+    assert FTS_TABLE not in inspect(engine).get_table_names()
+    with engine.connect() as connection:
+        triggers = connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").all()
+    assert triggers == []
+
+
+def test_create_all_builds_fts_for_the_native_backend(engine, search_backend):
+    search_backend("native")
+    Base.metadata.create_all(bind=engine)
+
+    assert FTS_TABLE in inspect(engine).get_table_names()
+    with engine.begin() as connection:
+        connection.exec_driver_sql("INSERT INTO books (title, author) VALUES ('Dune Messiah', 'Herbert')")
+        matched = connection.exec_driver_sql(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH 'dune'").all()
+    assert len(matched) == 1
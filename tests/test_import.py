@@ -0,0 +1,40 @@
+import json
+
+from app.models.book import Book
+
+
+def test_rejected_rows_fall_back_per_row_and_are_reported(client, db):
+    records = [
+        {"title": "Import Alpha", "author": "Importer", "isbn": "imp-0001"},
+        {"title": "Import Beta", "author": "Importer", "isbn": "imp-0001"},
+        {"title": "Import Gamma"},
+        {"title": "Import Delta", "author": "Importer", "inventory": {"total_copies": 2, "copies_available": 2}},
+    ]
+    response = client.post("/books/bulk", json=records)
+    assert response.status_code == 200, response.text
+    result = response.json()
+
+    assert result["done"] is True
+    assert (result["processed"], result["inserted"], result["failed"]) == (4, 2, 2)
+    assert [error["row"] for error in result["errors"]] == [2, 3]
+    assert "UNIQUE" in result["errors"][0]["error"]
+
+    stored = db.query(Book).filter(Book.title.like("Import %")).order_by(Book.id).all()
+    assert [book.title for book in stored] == ["Import Alpha", "Import Delta"]
+    assert stored[1].inventory.copies_available == 2
+
+
+def test_progress_stream_reports_each_chunk_then_done(client):
+    records = [{"title": f"Chunked {index}", "author": "Importer"} for index in range(5)]
+    response = client.post("/books/bulk", params={"progress": "true", "chunk_size": 2}, json=records)
+    events = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [event["processed"] for event in events] == [2, 4, 5]
+    assert [event["done"] for event in events] == [False, False, True]
+    assert events[-1]["inserted"] == 5
+
+
+def test_empty_import_still_finishes(client):
+    assert client.post("/books/bulk", json=[]).json()["done"] is True
+    response = client.post("/books/bulk", params={"progress": "true"}, json=[])
+    assert json.loads(response.text)["done"] is True
@@ -0,0 +1,61 @@
+def patch(client, adjustments, **params):
+    return client.patch("/books/inventory", json=adjustments, params=params)
+
+
+def test_invalid_adjustments_are_rejected_up_front(client, make_book):
+    book_id = make_book("Stocktake Validation")["id"]
+    for adjustment in (
+        {"book_id": book_id, "total_copies": 3, "total_copies_delta": 1},
+        {"book_id": book_id, "copies_available": 1, "copies_available_delta": -1},
+        {"book_id": book_id},
+    ):
+        assert patch(client, [adjustment]).status_code == 422, adjustment
+
+
+def test_deltas_and_absolute_values_are_applied_in_order(client, make_book):
+    book_id = make_book("Stocktake Deltas", copies=2)["id"]
+
+    response = patch(
+        client,
+        [
+            {"book_id": book_id, "total_copies_delta": 3},
+            {"book_id": book_id, "copies_available": 0},
+            {"book_id": book_id, "copies_available_delta": 4},
+        ],
+        chunk_size=2,
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["updated"], body["failed"]) == (3, 0)
+    assert [(item["total_copies"], item["copies_available"], item["status"]) for item in body["results"]] == [
+        (5, 2, "available"),
+        (5, 0, "borrowed"),
+        (5, 4, "available"),
+    ]
+
+    inventory = client.get(f"/books/{book_id}").json()["inventory"]
+    assert (inventory["total_copies"], inventory["copies_available"]) == (5, 4)
+
+
+def test_unknown_books_and_invalid_counts_fail_per_item(client, make_book):
+    book_id = make_book("Stocktake Failures", copies=2)["id"]
+
+    response = patch(
+        client,
+        [
+            {"book_id": 10**9, "total_copies": 1},
+            {"book_id": book_id, "copies_available_delta": 1},
+            {"book_id": book_id, "total_copies_delta": -3},
+            {"book_id": book_id, "total_copies": 6},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["updated"], body["failed"]) == (1, 3)
+    assert [item["error"] for item in body["results"]] == [
+        "Book not found",
+        "copies_available cannot exceed total_copies",
+        "Copy counts cannot be negative",
+        None,
+    ]
+    assert client.get(f"/books/{book_id}").json()["inventory"]["total_copies"] == 6
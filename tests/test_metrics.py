@@ -0,0 +1,22 @@
+from app.core.answer_cache import get_answer_cache
+
+
+def sample(client, name):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    (line,) = [line for line in response.text.splitlines() if line.startswith(f"{name} ")]
+    return float(line.split()[1])
+
+
+def test_answer_cache_saved_seconds_counter(client):
+    name = "assistant_answer_cache_saved_seconds_total"
+    assert f"# TYPE {name} counter" in client.get("/metrics").text
+    before = sample(client, name)
+
+    cache = get_answer_cache()
+    cache.set("metrics-test", "cached answer", [], completion_seconds=2.0)
+    assert cache.get("metrics-test") == "cached answer"
+
+    after = sample(client, name)
+    assert after > before
+    assert after == cache.stats()["saved_seconds"]
@@ -0,0 +1,60 @@
+import pytest
+from alembic import command
+from sqlalchemy import create_engine
+
+from app.core.database import Base
+from app.core.schema import SchemaOutOfDate, alembic_config, check_schema, missing_schema, verify_schema
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+    yield engine
+    engine.dispose()
+
+
+def run(engine, action, *arguments):
+    config = alembic_config()
+    config.attributes["configure_logger"] = False
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        action(config, *arguments)
+
+
+def test_upgrade_to_head_matches_the_models(engine):
+    run(engine, command.upgrade, "head")
+
+    verify_schema(engine, Base.metadata)
+    run(engine, command.check)
+
+
+def test_stamped_baseline_database_is_upgraded_and_verified(engine):
+    # Revision 0001 is exactly what create_all built before migrations existed.
+    run(engine, command.upgrade, "0001")
+    assert set(missing_schema(engine, Base.metadata)) == {
+        "book_trigrams",
+        "catalog_versions",
+        "transactions.returned_at",
+    }
+    with pytest.raises(SchemaOutOfDate, match="revision 0001"):
+        verify_schema(engine, Base.metadata)
+
+    run(engine, command.upgrade, "head")
+    verify_schema(engine, Base.metadata)
+
+
+def test_create_mode_reports_columns_create_all_cannot_add(engine):
+    run(engine, command.upgrade, "0001")
+    Base.metadata.create_all(bind=engine)
+
+    with pytest.raises(SchemaOutOfDate, match=r"transactions\.returned_at"):
+        check_schema(engine, Base.metadata)
+
+
+def test_verify_names_tables_missing_at_head(engine):
+    run(engine, command.upgrade, "head")
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE catalog_versions")
+
+    with pytest.raises(SchemaOutOfDate, match="missing catalog_versions"):
+        verify_schema(engine, Base.metadata)
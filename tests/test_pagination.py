@@ -0,0 +1,51 @@
+def page(client, path, **params):
+    response = client.get(path, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_book_cursor_pages_through_a_filtered_catalog(client, make_book):
+    ids = [make_book(f"Keyset Book {index}", category="Keyset Shelf", copies=index % 2)["id"] for index in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"category": "Keyset Shelf", "limit": 2}
+        if cursor is not None:
+            params["cursor"] = cursor
+        result = page(client, "/books/", **params)
+        seen.extend(book["id"] for book in result["items"])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ids
+
+    available = page(client, "/books/", category="Keyset Shelf", available=True)
+    assert [book["id"] for book in available["items"]] == ids[1::2]
+
+
+def test_sparse_fieldsets_return_only_the_requested_fields(client, make_book):
+    make_book("Sparse Fields", category="Sparse Shelf")
+
+    [book] = page(client, "/books/", category="Sparse Shelf", fields="title,inventory")["items"]
+    assert set(book) == {"id", "title", "inventory"}
+    assert book["title"] == "Sparse Fields"
+
+    response = client.get("/books/", params={"fields": "title,shelf_mark"})
+    assert response.status_code == 400
+    assert "shelf_mark" in response.json()["detail"]
+
+
+def test_user_cursor_and_role_filter(client):
+    ids = []
+    for index, role in enumerate(("student", "faculty", "student")):
+        response = client.post("/users/", json={"first_name": f"Keyset{index}", "last_name": "Users", "role": role})
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+
+    first = page(client, "/users/", cursor=ids[0] - 1, limit=2)
+    assert [user["id"] for user in first["items"]] == ids[:2]
+    assert first["next_cursor"] == ids[1]
+
+    students = page(client, "/users/", cursor=ids[0] - 1, role="student", fields="first_name")
+    assert [user["first_name"] for user in students["items"]] == ["Keyset0", "Keyset2"]
+    assert set(students["items"][0]) == {"id", "first_name"}
@@ -0,0 +1,95 @@
+import pytest
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core import catalog_events
+from app.core.config import get_settings
+from app.core.database import get_db
+from app.core.telemetry import QueryBudgetExceeded, RequestStats, current_request_stats, query_budget
+from app.main import app
+from app.models.book import Book
+from app.models.book_inventory import BookInventory
+
+n_plus_one = APIRouter(prefix="/_budget-test")
+
+
+@n_plus_one.get("/inventories")
+@query_budget(2)
+def list_inventories(db: Session = Depends(get_db)):
+    # One inventory lookup per book: the shape query budgets exist to catch.
+    books = db.scalars(select(Book)).all()
+    return [db.scalar(select(BookInventory.total_copies).where(BookInventory.book_id == book.id)) for book in books]
+
+
+app.include_router(n_plus_one)
+
+
+@pytest.fixture(autouse=True)
+def strict_budgets(monkeypatch):
+    monkeypatch.setenv("QUERY_BUDGET_STRICT", "true")
+    get_settings.cache_clear()
+    yield
+    monkeypatch.undo()
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def book_ids(make_book):
+    return [make_book(f"Budget {index}", acquisition={"publisher": "Press"})["id"] for index in range(3)]
+
+
+def test_book_routes_stay_within_budget(client, book_ids):
+    assert client.get("/books/works").status_code == 200
+    assert client.get("/books/").status_code == 200
+    assert client.get("/books/", params={"fields": "title,inventory"}).status_code == 200
+    assert client.get("/books/", params={"ids": ",".join(map(str, book_ids))}).status_code == 200
+    assert client.get(f"/books/{book_ids[0]}").status_code == 200
+    assert client.get("/books/export").status_code == 200
+
+    adjustments = [{"book_id": book_ids[0], "total_copies_delta": 1}, {"book_id": book_ids[1], "total_copies": 4}]
+    response = client.patch("/books/inventory", json=adjustments)
+    assert response.status_code == 200 and response.json()["updated"] == 2, response.text
+
+    response = client.put(f"/books/{book_ids[0]}", json={"title": "Renamed", "inventory": {"total_copies": 3}})
+    assert response.status_code == 200, response.text
+    assert client.delete(f"/books/{book_ids[-1]}").status_code == 204
+
+
+def test_user_routes_stay_within_budget(client):
+    response = client.post("/users/", json={"first_name": "Ada", "last_name": "Budget", "role": "faculty"})
+    assert response.status_code == 201, response.text
+    user_id = response.json()["id"]
+
+    assert client.get("/users/").status_code == 200
+    assert client.get(f"/users/{user_id}").status_code == 200
+    assert client.put(f"/users/{user_id}", json={"age": 40}).status_code == 200
+    assert client.get("/users/export").status_code == 200
+    assert client.delete(f"/users/{user_id}").status_code == 204
+
+
+def test_librarian_routes_stay_within_budget(client):
+    response = client.post("/librarians/", json={"name": "Budget", "email": "budget@example.com"})
+    assert response.status_code == 201, response.text
+    librarian_id = response.json()["id"]
+
+    assert client.get("/librarians/").status_code == 200
+    assert client.get(f"/librarians/{librarian_id}").status_code == 200
+    assert client.put(f"/librarians/{librarian_id}", json={"name": "Renamed"}).status_code == 200
+    assert client.delete(f"/librarians/{librarian_id}").status_code == 204
+
+
+def test_n_plus_one_route_fails_in_strict_mode(client, book_ids):
+    with pytest.raises(QueryBudgetExceeded):
+        client.get("/_budget-test/inventories")
+
+
+def test_catalog_listeners_are_not_charged_to_the_request(client, book_ids):
+    assert client.get("/books/works").status_code == 200
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    try:
+        catalog_events.publish(book_ids[:1])
+    finally:
+        current_request_stats.reset(token)
+    assert stats.queries == 0
@@ -0,0 +1,57 @@
+from sqlalchemy import update
+
+from app.core.search_index import book_search_index
+from app.models.book import Book
+from app.repositories.book_repository import BookRepository
+from app.repositories.catalog_version_repository import CatalogVersionRepository
+
+
+def search_ids(db, query):
+    return BookRepository(db).search_ids(query)
+
+
+def test_title_hit_outranks_a_shelf_location_hit(db, make_book):
+    shelved = make_book("Unrelated Atlas", book_location="Qorvex Wing")["id"]
+    titled = make_book("Qorvex Handbook")["id"]
+
+    assert search_ids(db, "qorvex") == [titled, shelved]
+
+
+def test_term_matches_inside_longer_tokens_below_whole_tokens(db, make_book):
+    whole = make_book("Vantrel Stories")["id"]
+    longer = make_book("Vantrelian Stories")["id"]
+
+    assert search_ids(db, "vantrel") == [whole, longer]
+    assert search_ids(db, "antreli") == [longer]
+
+
+def test_search_sees_books_renamed_by_another_worker(db, make_book):
+    book_id = make_book("Plindor Almanac")["id"]
+    assert search_ids(db, "plindor") == [book_id]
+
+    # Another worker's rename: the row and its version move, but no event reaches this process.
+    db.execute(update(Book).where(Book.id == book_id).values(title="Glabbet Almanac"))
+    CatalogVersionRepository(db).bump([book_id])
+    db.commit()
+
+    assert search_ids(db, "glabbet") == [book_id]
+    assert book_search_index.search("plindor") == []
+
+
+def test_misspelled_query_falls_back_to_trigram_matches(db, make_book):
+    book_id = make_book("Quillshaw Chronicles", author="Mervane Toddick")["id"]
+
+    assert search_ids(db, "quilshaw chronicals") == [book_id]
+    assert search_ids(db, "mervain todick") == [book_id]
+
+
+def test_trigram_fallback_sees_books_renamed_by_another_worker(db, make_book):
+    book_id = make_book("Brennicott Ledger")["id"]
+    assert search_ids(db, "brenicot") == [book_id]
+
+    db.execute(update(Book).where(Book.id == book_id).values(title="Osterwald Ledger"))
+    CatalogVersionRepository(db).bump([book_id])
+    db.commit()
+
+    assert search_ids(db, "osterwold") == [book_id]
+    assert search_ids(db, "brenicot") == []
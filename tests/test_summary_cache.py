@@ -0,0 +1,55 @@
+import asyncio
+import sqlite3
+import threading
+
+from app.core.summary_cache import MISSING, SummaryCache
+
+
+def disk_keys(path):
+    with sqlite3.connect(path) as db:
+        return {key for (key,) in db.execute("SELECT key FROM summaries")}
+
+
+def test_disk_tier_keeps_the_newest_rows(tmp_path):
+    path = str(tmp_path / "summaries.db")
+    cache = SummaryCache(max_size=2, ttl=100, negative_ttl=10, path=path, disk_size=3)
+    for index in range(5):
+        cache.set(f"Title {index}", f"summary {index}")
+    assert disk_keys(path) == {"title 2", "title 3", "title 4"}
+
+    restarted = SummaryCache(max_size=2, ttl=100, negative_ttl=10, path=path, disk_size=3)
+    assert restarted.get("Title 2") == "summary 2"
+    assert restarted.get("Title 0") is MISSING
+
+
+def test_set_sweeps_expired_rows(tmp_path):
+    path = str(tmp_path / "summaries.db")
+    cache = SummaryCache(max_size=4, ttl=100, negative_ttl=-1, path=path)
+    cache.set("Gone", None)
+    cache.set("Kept", "still here")
+    assert disk_keys(path) == {"kept"}
+
+
+def test_async_disk_io_runs_off_the_event_loop(tmp_path, monkeypatch):
+    path = str(tmp_path / "summaries.db")
+    SummaryCache(max_size=4, ttl=100, negative_ttl=10, path=path).set("Warm", "from disk")
+    cache = SummaryCache(max_size=4, ttl=100, negative_ttl=10, path=path)
+    threads = []
+    for name in ("_load", "_save"):
+        original = getattr(cache, name)
+
+        def recorded(*args, _original=original):
+            threads.append(threading.get_ident())
+            return _original(*args)
+
+        monkeypatch.setattr(cache, name, recorded)
+
+    async def exercise():
+        loop_thread = threading.get_ident()
+        assert await cache.aget("Warm") == "from disk"
+        await cache.aset("Fresh", None)
+        assert await cache.aget("Fresh") is None
+        return loop_thread
+
+    loop_thread = asyncio.run(exercise())
+    assert len(threads) == 2 and loop_thread not in threads
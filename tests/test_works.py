@@ -0,0 +1,40 @@
+from sqlalchemy import update
+
+from app.models.book_inventory import BookInventory
+from app.repositories.catalog_version_repository import CatalogVersionRepository
+
+
+def works(client, **params):
+    response = client.get("/books/works", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_cursor_pages_through_every_work_once(client, make_book):
+    ids = {title: make_book(title, author="Keyset Works")["id"] for title in ("Kw b", "Kw a", "Kw ab", "Kw c", "Kw d")}
+
+    first = works(client, title="Kw ", limit=2)
+    assert [work["title"] for work in first["items"]] == ["Kw a", "Kw ab"]
+
+    # Dropping the group the cursor points at must neither skip nor repeat a work.
+    assert client.delete(f"/books/{ids['Kw ab']}").status_code == 204
+    second = works(client, title="Kw ", limit=2, cursor=first["next_cursor"])
+    third = works(client, title="Kw ", limit=2, cursor=second["next_cursor"])
+
+    assert [work["title"] for work in second["items"]] == ["Kw b", "Kw c"]
+    assert [work["title"] for work in third["items"]] == ["Kw d"]
+    assert third["next_cursor"] is None
+
+
+def test_works_reflect_changes_committed_by_another_worker(client, db, make_book):
+    book_id = make_book("Rollup Behind Its Back", copies=2)["id"]
+    [work] = works(client, title="Rollup Behind Its Back")["items"]
+    assert work["available_copies"] == 2
+
+    # What another worker's checkout leaves behind: new counts and a bumped version, but no event here.
+    db.execute(update(BookInventory).where(BookInventory.book_id == book_id).values(copies_available=0))
+    CatalogVersionRepository(db).bump([book_id])
+    db.commit()
+
+    [work] = works(client, title="Rollup Behind Its Back")["items"]
+    assert work["available_copies"] == 0